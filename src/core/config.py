@@ -1,5 +1,6 @@
 """Configuration settings for the application."""
 
+import functools
 import os
 import secrets
 import tomllib
@@ -29,8 +30,12 @@ class ProjectInfo(TypedDict):
     description: str
 
 
+@functools.cache
 def load_project_info() -> ProjectInfo:
-    """Load project metadata from pyproject.toml."""
+    """Load project metadata from pyproject.toml.
+
+    The result is cached; call ``load_project_info.cache_clear()`` to re-read.
+    """
     pyproject_path = parent_dir / "pyproject.toml"
 
     if not pyproject_path.exists():
@@ -114,6 +119,12 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False)
 
     access_token_expire_minutes: int = Field(default=30)
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt work factor (log2 rounds) used when hashing passwords",
+    )
 
     @field_validator("jwt_algorithm", mode="before")
     @classmethod
@@ -142,7 +153,7 @@ class Settings(BaseSettings):
             username=self.database_user,
             password=self.database_password.get_secret_value(),
             host=self.database_host,
-            port=self.port,
+            port=self.database_port,
             path=self.database_name,
         )
 
@@ -1,16 +1,42 @@
 """Security utilities for password hashing and verification using bcrypt."""
 
-from datetime import UTC, datetime, timedelta
+import json
+import time
+from datetime import timedelta
+from typing import Protocol
 
 import bcrypt
+import jwt
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt
+from jwt import api_jws
 
 from src.core.config import settings
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/token", scheme_name="Bearer")
 
+_JWT_SECRET: str
+_JWT_ALGORITHM: str
+
+_DEFAULT_TOKEN_TTL = timedelta(minutes=15)
+
+# Built once; json.dumps would construct a new encoder on every call.
+_encode_claims = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _reload_jwt_config() -> None:
+    """Re-read the JWT signing key and algorithm from settings.
+
+    Both are cached at import time; call this after changing them on
+    ``settings``.
+    """
+    global _JWT_SECRET, _JWT_ALGORITHM  # noqa: PLW0603
+    _JWT_SECRET = settings.jwt_secret_key.get_secret_value()
+    _JWT_ALGORITHM = settings.jwt_algorithm
+
+
+_reload_jwt_config()
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt.
@@ -22,7 +48,7 @@ def hash_password(password: str) -> str:
         The hashed password as a string.
 
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
@@ -44,6 +70,30 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+class PasswordHasher(Protocol):
+    """Hashes passwords and verifies them against stored hashes."""
+
+    def hash(self, password: str) -> str:
+        """Return the hash to store for ``password``."""
+        ...
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Return whether ``plain_password`` matches ``hashed_password``."""
+        ...
+
+
+class BcryptPasswordHasher:
+    """Password hasher backed by bcrypt."""
+
+    def hash(self, password: str) -> str:
+        """Hash a password using bcrypt."""
+        return hash_password(password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against a bcrypt hash."""
+        return verify_password(plain_password, hashed_password)
+
+
 def create_access_token(
     data: dict,
     expires_delta: timedelta | None = None,
@@ -61,19 +111,43 @@ def create_access_token(
 
     """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(UTC) + expires_delta
-    else:
-        expire = datetime.now(UTC) + timedelta(minutes=15)
+    ttl = expires_delta or _DEFAULT_TOKEN_TTL
     to_encode.update(
         {
-            "exp": expire,
+            "exp": int(time.time() + ttl.total_seconds()),
             "iss": settings.jwt_issuer,
             "aud": settings.jwt_audience,
         },
     )
-    return jwt.encode(
-        to_encode,
-        settings.jwt_secret_key.get_secret_value(),
-        algorithm=settings.jwt_algorithm,
+    return api_jws.encode(
+        _encode_claims(to_encode).encode("utf-8"),
+        _JWT_SECRET,
+        algorithm=_JWT_ALGORITHM,
+    )
+
+
+def decode_access_token(token: str) -> dict:
+    """Decode and validate a JWT access token.
+
+    Uses the same cached key and algorithm as ``create_access_token`` and
+    checks the issuer, audience and expiry.
+
+    Args:
+        token: The encoded JWT token string.
+
+    Returns:
+        The decoded token claims.
+
+    Raises:
+        jwt.PyJWTError: If the token is invalid or fails validation.
+
+    """
+    return jwt.decode(
+        token,
+        _JWT_SECRET,
+        algorithms=[_JWT_ALGORITHM],
+        issuer=settings.jwt_issuer,
+        audience=settings.jwt_audience,
+        options={"verify_aud": True},
+        leeway=settings.clock_skew_leeway_seconds,
     )
@@ -1,21 +1,31 @@
 """User schemas."""
 
+import re
 import uuid
 from datetime import datetime
 from typing import Annotated
 
+from email_validator import SPECIAL_USE_DOMAIN_NAMES
 from pydantic import (
     AfterValidator,
     BaseModel,
     ConfigDict,
-    EmailStr,
     Field,
     SecretStr,
+    WithJsonSchema,
 )
+from pydantic.networks import validate_email
 
 
 MIN_PASSWORD_LENGTH = 8
 
+MAX_EMAIL_LOCAL_LENGTH = 64
+MAX_EMAIL_LENGTH = 254
+_ASCII_EMAIL = re.compile(
+    r"(?P<local>[A-Za-z0-9_%+-]+(?:\.[A-Za-z0-9_%+-]+)*)"
+    r"@(?P<domain>(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63})",
+)
+
 
 class PasswordStrengthError(ValueError):
     """Exception for password strength errors."""
@@ -24,7 +34,7 @@ class PasswordStrengthError(ValueError):
 def validate_password_complexity(v: SecretStr) -> SecretStr:
     """Validate password complexity."""
     value = v.get_secret_value()
-    if not any(char.isdigit() for char in value):
+    if not any(map(str.isdigit, value)):
         msg = "Password must contain a number"
         raise PasswordStrengthError(msg)
     if len(value) < MIN_PASSWORD_LENGTH:
@@ -39,6 +49,35 @@ PasswordStr = Annotated[
 ]
 
 
+def normalize_email(value: str) -> str:
+    """Validate and normalize an email address the way ``EmailStr`` does.
+
+    Plain ASCII addresses are checked with one regex and only have their domain
+    lowercased; anything else goes through email-validator.
+    """
+    match = _ASCII_EMAIL.fullmatch(value)
+    if (
+        match
+        and len(value) <= MAX_EMAIL_LENGTH
+        and len(match["local"]) <= MAX_EMAIL_LOCAL_LENGTH
+        and "--" not in match["domain"]
+    ):
+        domain = match["domain"].lower()
+        if not any(
+            domain == name or domain.endswith(f".{name}")
+            for name in SPECIAL_USE_DOMAIN_NAMES
+        ):
+            return f"{match['local']}@{domain}"
+    return validate_email(value)[1]
+
+
+EmailAddressStr = Annotated[
+    str,
+    AfterValidator(normalize_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
 class UserBase(BaseModel):
     """Base user schema."""
 
@@ -48,7 +87,7 @@ class UserBase(BaseModel):
         max_length=255,
         description="User's full name",
     )
-    email: EmailStr = Field(..., description="User's email address")
+    email: EmailAddressStr = Field(..., description="User's email address")
 
 
 class UserCreate(UserBase):
@@ -70,7 +109,7 @@ class UserUpdate(BaseModel):
         max_length=255,
         description="User's full name",
     )
-    email: EmailStr | None = Field(None, description="User's email address")
+    email: EmailAddressStr | None = Field(None, description="User's email address")
     password: PasswordStr | None = Field(
         None,
         max_length=100,
@@ -112,7 +151,7 @@ class UserListResponse(BaseModel):
 class UserLogin(BaseModel):
     """Schema for user login."""
 
-    email: EmailStr = Field(..., description="User's email address")
+    email: EmailAddressStr = Field(..., description="User's email address")
     password: SecretStr = Field(..., description="User's password")
 
 
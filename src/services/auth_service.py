@@ -2,11 +2,15 @@
 
 from datetime import timedelta
 
-from jose import JWTError, jwt
+import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
-from src.core.security import create_access_token, oauth2_scheme
+from src.core.security import (
+    create_access_token,
+    decode_access_token,
+    oauth2_scheme,
+)
 from src.models.user import User
 from src.schemas.user import Token, UserCreate, UserLogin
 from src.services.user_service import (
@@ -141,17 +145,7 @@ class AuthService:
 
         """
         try:
-            payload = jwt.decode(
-                token,
-                settings.jwt_secret_key.get_secret_value(),
-                algorithms=[settings.jwt_algorithm],
-                issuer=settings.jwt_issuer,
-                audience=settings.jwt_audience,
-                options={
-                    "verify_aud": True,
-                    "leeway": settings.clock_skew_leeway_seconds,
-                },
-            )
+            payload = decode_access_token(token)
             email: str | None = payload.get("sub", None)
             if email is None:
                 raise TokenValidationError("Token missing subject (email)")
@@ -160,13 +154,15 @@ class AuthService:
                     "Token audience validation failed: "
                     "audience claim missing or invalid",
                 )
-        except JWTError as e:
-            error_msg = str(e)
-            if "issuer" in error_msg.lower():
+        except jwt.PyJWTError as e:
+            missing_claim = (
+                e.claim if isinstance(e, jwt.MissingRequiredClaimError) else None
+            )
+            if isinstance(e, jwt.InvalidIssuerError) or missing_claim == "iss":
                 raise TokenValidationError(
                     f"Token issuer validation failed: {e!s}",
                 ) from e
-            if "audience" in error_msg.lower() or "aud" in error_msg.lower():
+            if isinstance(e, jwt.InvalidAudienceError) or missing_claim == "aud":
                 raise TokenValidationError(
                     f"Token audience validation failed: {e!s}",
                 ) from e
@@ -3,8 +3,9 @@
 import uuid
 
 from redis.asyncio import Redis
-from sqlalchemy import func, select, update
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Insert, func, insert, inspect, select, update
+from sqlalchemy.orm import load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.database.database import AsyncSession
 from src.models.prompt import Prompt, PromptVersion
@@ -21,26 +22,28 @@ class PromptNotFoundError(PromptServiceError):
 class PromptService:
     """Prompt service."""
 
+    _CACHE_PREFIX = "prompt_cache:"
+
     def __init__(self, session: AsyncSession, redis: Redis) -> None:
         """Initialize the prompt service."""
         self.session = session
         self.redis = redis
-        self.cache_prefix = "prompt_cache:"
+        self.cache_prefix = self._CACHE_PREFIX
         self.cache_ttl = 3600
 
     def _get_cache_key(self, slug: str) -> str:
-        return f"{self.cache_prefix}{slug}"
+        return self.cache_prefix + slug
 
     @staticmethod
     async def get_cached_content(
         session: AsyncSession,
         redis: Redis,
         slug: str,
-        cache_prefix: str = "prompt_cache:",
+        cache_prefix: str = _CACHE_PREFIX,
         cache_ttl: int = 3600,
     ) -> str:
         """Get cached content for a prompt."""
-        key = f"{cache_prefix}{slug}"
+        key = cache_prefix + slug
 
         cached_val = await redis.get(key)
         if cached_val:
@@ -59,14 +62,79 @@ class PromptService:
 
         raise PromptNotFoundError(f"Prompt not found: {slug}") from None
 
-    async def invalidate_cache(self, slug: str) -> None:
-        """Invalidate the cache for a prompt."""
-        await self.redis.delete(self._get_cache_key(slug))
+    @staticmethod
+    async def get_cached_contents(
+        session: AsyncSession,
+        redis: Redis,
+        slugs: list[str],
+        cache_prefix: str = _CACHE_PREFIX,
+        cache_ttl: int = 3600,
+    ) -> dict[str, str]:
+        """Get cached content for several prompts, keyed by slug.
+
+        Cache hits are read with a single MGET; misses are loaded with one
+        query and written back in a single pipeline.
+        """
+        slugs = list(dict.fromkeys(slugs))
+        if not slugs:
+            return {}
+
+        cached_vals = await redis.mget([cache_prefix + slug for slug in slugs])
+
+        contents: dict[str, str] = {}
+        missing: list[str] = []
+        for slug, cached_val in zip(slugs, cached_vals, strict=True):
+            if cached_val:
+                if isinstance(cached_val, bytes):
+                    contents[slug] = cached_val.decode("utf-8")
+                else:
+                    contents[slug] = str(cached_val)
+            else:
+                missing.append(slug)
+
+        if not missing:
+            return contents
+
+        result = await session.execute(
+            select(Prompt.slug, Prompt.content).where(Prompt.slug.in_(missing)),
+        )
+        loaded = {slug: content for slug, content in result.all() if content}
+
+        not_found = [slug for slug in missing if slug not in loaded]
+        if not_found:
+            raise PromptNotFoundError(
+                f"Prompt not found: {', '.join(not_found)}",
+            ) from None
+
+        async with redis.pipeline(transaction=False) as pipe:
+            for slug, content in loaded.items():
+                pipe.set(cache_prefix + slug, content, ex=cache_ttl)
+            await pipe.execute()
+
+        contents.update(loaded)
+        return {slug: contents[slug] for slug in slugs}
+
+    async def invalidate_cache(self, *slugs: str) -> None:
+        """Invalidate the cache for one or more prompts.
+
+        Keys are removed with a single UNLINK, which frees memory in the
+        background instead of blocking the server like DEL.
+        """
+        if slugs:
+            await self.redis.unlink(*(self._get_cache_key(slug) for slug in slugs))
 
     async def get_all_prompts_for_admin(self) -> list[Prompt]:
-        """Get all prompts for the admin."""
+        """Get all prompts for the admin.
+
+        Only the columns the prompt list needs are loaded; ``content`` is left
+        deferred, and ordering is served by the unique index on ``slug``.
+        """
         result = await self.session.execute(
-            select(Prompt).order_by(Prompt.slug),
+            select(Prompt)
+            .options(
+                load_only(Prompt.id, Prompt.slug, Prompt.name, Prompt.created_at),
+            )
+            .order_by(Prompt.slug),
         )
         return list(result.scalars().all())
 
@@ -126,41 +194,130 @@ class PromptService:
 
                 return new_prompt.id
 
-        await self.session.execute(
-            update(Prompt)
-            .where(Prompt.id == prompt_id)
-            .values(name=name, content=content, slug=slug),
-        )
+        if self.session.get_bind().dialect.name == "postgresql":
+            await self.session.execute(
+                self._commit_version_statement(
+                    prompt_id,
+                    slug,
+                    name,
+                    content,
+                    commit_msg,
+                    user_id,
+                ),
+            )
+            self._sync_loaded_prompt(prompt_id, slug, name, content)
+        else:
+            await self.session.execute(
+                update(Prompt)
+                .where(Prompt.id == prompt_id)
+                .values(name=name, content=content, slug=slug),
+            )
 
-        max_ver_result = await self.session.execute(
-            select(func.max(PromptVersion.version_number)).where(
-                PromptVersion.prompt_id == prompt_id,
-            ),
-        )
-        current_max = max_ver_result.scalar()
-        next_ver = (current_max or 0) + 1
+            max_ver_result = await self.session.execute(
+                select(func.max(PromptVersion.version_number)).where(
+                    PromptVersion.prompt_id == prompt_id,
+                ),
+            )
+            current_max = max_ver_result.scalar()
+            next_ver = (current_max or 0) + 1
 
-        await self.session.execute(
-            update(PromptVersion)
-            .where(PromptVersion.prompt_id == prompt_id)
-            .values(is_active=False),
-        )
+            await self.session.execute(
+                update(PromptVersion)
+                .where(PromptVersion.prompt_id == prompt_id)
+                .values(is_active=False),
+            )
 
-        new_version = PromptVersion(
-            prompt_id=prompt_id,
-            content=content,
-            commit_message=commit_msg,
-            is_active=True,
-            created_by_id=user_id,
-            version_number=next_ver,
-        )
-        self.session.add(new_version)
+            new_version = PromptVersion(
+                prompt_id=prompt_id,
+                content=content,
+                commit_message=commit_msg,
+                is_active=True,
+                created_by_id=user_id,
+                version_number=next_ver,
+            )
+            self.session.add(new_version)
 
         await self.session.commit()
         await self.invalidate_cache(slug)
 
         return prompt_id
 
+    @staticmethod
+    def _commit_version_statement(
+        prompt_id: uuid.UUID,
+        slug: str,
+        name: str,
+        content: str,
+        commit_msg: str,
+        user_id: uuid.UUID | None,
+    ) -> Insert:
+        """Build a single statement that commits a new active version.
+
+        The prompt update and the deactivation of earlier versions run as
+        data-modifying CTEs of the version INSERT, so the whole commit is one
+        round-trip. All parts see the same snapshot, so the new version is not
+        deactivated and its number is computed from the existing ones.
+        """
+        deactivated = (
+            update(PromptVersion)
+            .where(
+                PromptVersion.prompt_id == prompt_id,
+                PromptVersion.is_active.is_(True),
+            )
+            .values(is_active=False)
+            .returning(PromptVersion.id)
+            .cte("deactivated")
+        )
+        updated_prompt = (
+            update(Prompt)
+            .where(Prompt.id == prompt_id)
+            .values(name=name, content=content, slug=slug)
+            .returning(Prompt.id)
+            .cte("updated_prompt")
+        )
+        next_ver = (
+            select(func.coalesce(func.max(PromptVersion.version_number), 0) + 1)
+            .where(PromptVersion.prompt_id == prompt_id)
+            .scalar_subquery()
+        )
+        return (
+            insert(PromptVersion)
+            .values(
+                id=uuid.uuid4(),
+                prompt_id=prompt_id,
+                content=content,
+                commit_message=commit_msg,
+                is_active=True,
+                created_by_id=user_id,
+                version_number=next_ver,
+            )
+            .add_cte(deactivated)
+            .add_cte(updated_prompt)
+        )
+
+    def _sync_loaded_prompt(
+        self,
+        prompt_id: uuid.UUID,
+        slug: str,
+        name: str,
+        content: str,
+    ) -> None:
+        """Apply a committed version to the prompt objects already loaded.
+
+        The commit statement is plain Core DML, so unlike ``update(...)`` with
+        the ORM it does not touch the identity map. Loaded instances are given
+        the committed values instead of being expired, which would make a later
+        attribute access lazy-load outside the async context.
+        """
+        for obj in self.session.identity_map.values():
+            state = inspect(obj).dict
+            if isinstance(obj, PromptVersion) and state.get("prompt_id") == prompt_id:
+                set_committed_value(obj, "is_active", value=False)
+            elif isinstance(obj, Prompt) and state.get("id") == prompt_id:
+                set_committed_value(obj, "name", name)
+                set_committed_value(obj, "content", content)
+                set_committed_value(obj, "slug", slug)
+
     async def activate_version(self, version_id: str, prompt_id: str) -> bool:
         """Rollbacks/Activates a specific version."""
         v_uuid = uuid.UUID(version_id)
@@ -3,11 +3,11 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import exists, func, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.security import hash_password, verify_password
+from src.core.security import BcryptPasswordHasher, PasswordHasher
 from src.models.user import User
 from src.schemas.user import UserCreate, UserUpdate
 
@@ -39,14 +39,20 @@ class UserAlreadyDeletedError(UserServiceError):
 class UserService:
     """Service for user operations."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        hasher: PasswordHasher | None = None,
+    ) -> None:
         """Initialize the user service.
 
         Args:
             session: The database session to use.
+            hasher: The password hasher to use. Defaults to bcrypt.
 
         """
         self.session = session
+        self.hasher = hasher or BcryptPasswordHasher()
 
     async def create_user(self, user_data: UserCreate) -> User:
         """Create a new user.
@@ -66,7 +72,7 @@ class UserService:
             msg = f"User with email {user_data.email} already exists"
             raise UserAlreadyExistsError(msg)
 
-        hashed_password = hash_password(user_data.password.get_secret_value())
+        hashed_password = self.hasher.hash(user_data.password.get_secret_value())
 
         user = User(
             name=user_data.name,
@@ -169,7 +175,7 @@ class UserService:
         user_id: uuid.UUID,
         *,
         hard_delete: bool = False,
-    ) -> bool:
+    ) -> User:
         """Delete a user (soft delete by default).
 
         Args:
@@ -178,29 +184,46 @@ class UserService:
                 If False, soft delete.
 
         Returns:
-            True if the user was deleted, False if not found.
+            The deleted user.
 
         Raises:
             ValueError: If the user is not found.
 
         """
+        if not hard_delete:
+            return await self._soft_delete_user(user_id)
+
         user = await self.get_user_by_id(user_id)
         if not user:
             msg = f"User with ID {user_id} not found"
             raise UserNotFoundError(msg)
 
-        if not hard_delete and user.is_deleted:
+        await self.session.delete(user)
+        await self.session.flush()
+        return user
+
+    async def _soft_delete_user(self, user_id: uuid.UUID) -> User:
+        """Soft delete a user with a single UPDATE ... RETURNING.
+
+        The ``is_deleted`` check is part of the statement, so the user is only
+        looked up again when nothing was updated, to pick the right error.
+        """
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id, User.is_deleted.is_(False))
+            .values(is_deleted=True, deleted_at=datetime.now(UTC))
+            .returning(User),
+        )
+        user = result.scalar_one_or_none()
+        if user:
+            return user
+
+        if await self.get_user_by_id(user_id):
             msg = f"User with ID {user_id} is already deleted"
             raise UserAlreadyDeletedError(msg)
 
-        if hard_delete:
-            await self.session.delete(user)
-        else:
-            user.is_deleted = True
-            user.deleted_at = datetime.now(UTC)
-
-        await self.session.flush()
-        return True
+        msg = f"User with ID {user_id} not found"
+        raise UserNotFoundError(msg)
 
     async def list_users(
         self,
@@ -224,13 +247,9 @@ class UserService:
         if not include_deleted:
             criteria.append(User.is_deleted.is_(False))
 
-        count_query = select(func.count()).select_from(User)
-        if criteria:
-            count_query = count_query.where(*criteria)
-
-        total = await self.session.scalar(count_query) or 0
-
-        query = select(User)
+        # The total rides along with each row as a window count, so the page
+        # and the count come back in one round trip.
+        query = select(User, func.count().over().label("total"))
         if criteria:
             query = query.where(*criteria)
 
@@ -241,9 +260,21 @@ class UserService:
         )
 
         result = await self.session.execute(query)
-        users = list(result.scalars().all())
+        rows = result.all()
+        if rows:
+            return [row.User for row in rows], rows[0].total
 
-        return users, total
+        # An empty first page means there are no users, unless the page
+        # itself is empty.
+        if page == 1 and page_size > 0:
+            return [], 0
+
+        # Past the last page there are no rows to carry the total.
+        count_query = select(func.count()).select_from(User)
+        if criteria:
+            count_query = count_query.where(*criteria)
+
+        return [], await self.session.scalar(count_query) or 0
 
     async def verify_user_password(
         self,
@@ -264,13 +295,12 @@ class UserService:
         if not user:
             return None
 
-        if not verify_password(password, user.hashed_password):
+        if not self.hasher.verify(password, user.hashed_password):
             return None
 
         return user
 
     async def user_exists(self, email: str) -> bool:
         """Check existence efficiently."""
-        query = select(1).where(User.email == email).limit(1)
-        result = await self.session.execute(query)
-        return result.scalar() is not None
+        query = select(exists().where(User.email == email))
+        return bool(await self.session.scalar(query))
@@ -1,26 +1,47 @@
 """Pytest configuration and fixtures."""
 
-from collections.abc import AsyncGenerator
+import functools
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
+from datetime import timedelta
+from typing import Any
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Connection, event, insert
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import StaticPool
 
+from src.core.config import settings
+from src.core.security import BcryptPasswordHasher, hash_password
 from src.database.database import Base, get_async_session
 from src.main import app
-
-
-# Use in-memory SQLite for testing
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
-
+from src.models.user import User
+from src.schemas.user import Token
+from src.services.auth_service import AuthService
+
+
+# Use in-memory SQLite for testing, one named database per pytest-xdist worker.
+# Set TEST_DATABASE_URL to run against another database (e.g. PostgreSQL);
+# a "{worker}" placeholder in it is replaced with the xdist worker id.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+TEST_DATABASE_URL = os.environ.get(
+    "TEST_DATABASE_URL",
+    "sqlite+aiosqlite:///file:test_{worker}?mode=memory&cache=shared&uri=true",
+).format(worker=XDIST_WORKER)
+
+# One connection per worker, opened once and reused by every test, so no
+# test pays for a reconnect.
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
     future=True,
+    poolclass=StaticPool,
 )
 
 TestAsyncSessionLocal = async_sessionmaker(
@@ -31,18 +52,55 @@ TestAsyncSessionLocal = async_sessionmaker(
 )
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+def _configure_sqlite(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Relax durability and let SQLAlchemy manage transactions itself.
+
+    pysqlite's own BEGIN handling breaks SAVEPOINT, so autocommit is turned
+    on here and BEGIN is emitted from the ``begin`` hook below.
+    """
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _begin_sqlite(conn: Connection) -> None:
+    conn.exec_driver_sql("BEGIN")
 
-    async with TestAsyncSessionLocal() as session:
-        yield session
-        await session.rollback()
 
+if test_engine.dialect.name == "sqlite":
+    event.listen(test_engine.sync_engine, "connect", _configure_sqlite)
+    event.listen(test_engine.sync_engine, "begin", _begin_sqlite)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _db_schema() -> AsyncGenerator[None, None]:
+    """Create the schema once per test session."""
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(_db_schema: None) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test database session inside a transaction rolled back after.
+
+    Commits made by the code under test only release a SAVEPOINT, so nothing
+    persists between tests.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        async with TestAsyncSessionLocal(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await trans.rollback()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -65,14 +123,92 @@ async def client(
     app.dependency_overrides.clear()
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session")
 async def client_no_db() -> AsyncGenerator[AsyncClient, None]:
     """Create a test client without database session override.
 
-    Use this for endpoints that don't require database access.
+    Use this for endpoints that don't require database access. The client is
+    shared for the whole session, which works because every test runs on the
+    session event loop (see ``asyncio_default_test_loop_scope``).
     """
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
     ) as ac:
         yield ac
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _fast_bcrypt() -> Iterator[None]:
+    """Hash passwords with the minimum bcrypt work factor during tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "bcrypt_rounds", 4)
+        yield
+
+
+@functools.cache
+def cached_password_hash(password: str) -> str:
+    """Hash a password once per test process and reuse the result."""
+    return hash_password(password)
+
+
+@pytest.fixture(scope="session")
+def hashed() -> Callable[[str], str]:
+    """Return a function that hashes a password once and reuses the result."""
+    return cached_password_hash
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _cached_user_hashing() -> Iterator[None]:
+    """Reuse one hash per password for users created through UserService.
+
+    Most tests register users with the same literal password, so hashing it
+    again for every ``create_user`` call is wasted work. Tests that exercise
+    ``hash_password`` itself call it directly and are unaffected.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            BcryptPasswordHasher,
+            "hash",
+            staticmethod(cached_password_hash),
+        )
+        yield
+
+
+async def _bulk_insert(
+    session: AsyncSession,
+    model: type[Base],
+    rows: list[dict[str, Any]],
+) -> None:
+    """Insert rows with one executemany INSERT, bypassing the unit of work."""
+    await session.execute(insert(model), rows)
+    await session.commit()
+
+
+@pytest.fixture(scope="session")
+def bulk_insert() -> Callable[..., Awaitable[None]]:
+    """Return a function that inserts many rows of a model in one statement."""
+    return _bulk_insert
+
+
+@pytest.fixture
+def make_user_and_token(
+    db_session: AsyncSession,
+) -> Callable[..., Awaitable[tuple[User, Token]]]:
+    """Return a factory that persists a user and issues a token for it."""
+
+    async def _make_user_and_token(
+        auth_service: AuthService,
+        password: str = "SecurePass123",
+        expires_delta: timedelta | None = None,
+    ) -> tuple[User, Token]:
+        user = User(
+            name="Test User",
+            email="test@example.com",
+            hashed_password=cached_password_hash(password),
+        )
+        db_session.add(user)
+        await db_session.commit()
+        return user, auth_service.create_token(user, expires_delta=expires_delta)
+
+    return _make_user_and_token
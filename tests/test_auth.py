@@ -1,6 +1,5 @@
 """Tests for authentication endpoints."""
 
-import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,7 +7,6 @@ from src.core.security import hash_password
 from src.models.user import User
 
 
-@pytest.mark.asyncio
 async def test_register_success(client: AsyncClient, db_session: AsyncSession) -> None:
     """Test successful user registration."""
     user_data = {
@@ -28,7 +26,6 @@ async def test_register_success(client: AsyncClient, db_session: AsyncSession) -
     assert "password" not in data
 
 
-@pytest.mark.asyncio
 async def test_register_duplicate_email(
     client: AsyncClient,
     db_session: AsyncSession,
@@ -50,7 +47,6 @@ async def test_register_duplicate_email(
     assert "already exists" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
 async def test_register_invalid_password(client: AsyncClient) -> None:
     """Test registration with invalid password fails."""
     user_data = {
@@ -64,7 +60,6 @@ async def test_register_invalid_password(client: AsyncClient) -> None:
     assert response.status_code == 422  # Validation error
 
 
-@pytest.mark.asyncio
 async def test_register_invalid_email(client: AsyncClient) -> None:
     """Test registration with invalid email fails."""
     user_data = {
@@ -78,7 +73,6 @@ async def test_register_invalid_email(client: AsyncClient) -> None:
     assert response.status_code == 422  # Validation error
 
 
-@pytest.mark.asyncio
 async def test_login_success(
     client: AsyncClient,
     db_session: AsyncSession,
@@ -111,7 +105,6 @@ async def test_login_success(
     assert len(data["access_token"]) > 0
 
 
-@pytest.mark.asyncio
 async def test_login_invalid_email(client: AsyncClient) -> None:
     """Test login with non-existent email fails."""
     login_data = {
@@ -125,7 +118,6 @@ async def test_login_invalid_email(client: AsyncClient) -> None:
     assert "incorrect email or password" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
 async def test_login_invalid_password(
     client: AsyncClient,
     db_session: AsyncSession,
@@ -153,7 +145,6 @@ async def test_login_invalid_password(
     assert "incorrect email or password" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
 async def test_validate_token_success(
     client: AsyncClient,
     db_session: AsyncSession,
@@ -190,7 +181,6 @@ async def test_validate_token_success(
     assert data["user_id"] == str(user.id)
 
 
-@pytest.mark.asyncio
 async def test_validate_token_missing_header(client: AsyncClient) -> None:
     """Test token validation without authorization header fails."""
     response = await client.get("/v1/auth/validate-token")
@@ -198,7 +188,6 @@ async def test_validate_token_missing_header(client: AsyncClient) -> None:
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_validate_token_invalid_token(client: AsyncClient) -> None:
     """Test token validation with invalid token fails."""
     response = await client.get(
@@ -209,7 +198,6 @@ async def test_validate_token_invalid_token(client: AsyncClient) -> None:
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_get_current_user_success(
     client: AsyncClient,
     db_session: AsyncSession,
@@ -251,7 +239,6 @@ async def test_get_current_user_success(
     assert "password" not in data
 
 
-@pytest.mark.asyncio
 async def test_get_current_user_missing_token(client: AsyncClient) -> None:
     """Test getting current user without token fails."""
     response = await client.get("/v1/auth/users/me")
@@ -259,7 +246,6 @@ async def test_get_current_user_missing_token(client: AsyncClient) -> None:
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_get_current_user_invalid_token(client: AsyncClient) -> None:
     """Test getting current user with invalid token fails."""
     response = await client.get(
@@ -270,7 +256,6 @@ async def test_get_current_user_invalid_token(client: AsyncClient) -> None:
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_register_empty_name(client: AsyncClient) -> None:
     """Test registration with empty name fails."""
     user_data = {
@@ -284,7 +269,6 @@ async def test_register_empty_name(client: AsyncClient) -> None:
     assert response.status_code == 422  # Validation error
 
 
-@pytest.mark.asyncio
 async def test_register_password_no_digit(client: AsyncClient) -> None:
     """Test registration with password without digit fails."""
     user_data = {
@@ -298,7 +282,6 @@ async def test_register_password_no_digit(client: AsyncClient) -> None:
     assert response.status_code == 422  # Validation error
 
 
-@pytest.mark.asyncio
 async def test_login_missing_fields(client: AsyncClient) -> None:
     """Test login with missing fields fails."""
     # Missing password
@@ -1,16 +1,17 @@
 """Tests for auth service."""
 
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 
+import jwt
 import pytest
-from jose import jwt
 from pydantic import SecretStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
 from src.core.security import hash_password
 from src.models.user import User
-from src.schemas.user import UserCreate, UserLogin
+from src.schemas.user import Token, UserCreate, UserLogin
 from src.services.auth_service import (
     AuthService,
     InvalidCredentialsError,
@@ -19,7 +20,6 @@ from src.services.auth_service import (
 from src.services.user_service import UserAlreadyExistsError
 
 
-@pytest.mark.asyncio
 async def test_register_user_success(db_session: AsyncSession) -> None:
     """Test successful user registration."""
     auth_service = AuthService(db_session)
@@ -38,7 +38,6 @@ async def test_register_user_success(db_session: AsyncSession) -> None:
     assert user.is_deleted is False
 
 
-@pytest.mark.asyncio
 async def test_register_user_duplicate_email(db_session: AsyncSession) -> None:
     """Test registration with duplicate email raises error."""
     auth_service = AuthService(db_session)
@@ -57,7 +56,6 @@ async def test_register_user_duplicate_email(db_session: AsyncSession) -> None:
         await auth_service.register_user(user_data)
 
 
-@pytest.mark.asyncio
 async def test_authenticate_user_success(db_session: AsyncSession) -> None:
     """Test successful user authentication."""
     auth_service = AuthService(db_session)
@@ -71,7 +69,6 @@ async def test_authenticate_user_success(db_session: AsyncSession) -> None:
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Authenticate
     user_data = UserLogin(
@@ -84,7 +81,6 @@ async def test_authenticate_user_success(db_session: AsyncSession) -> None:
     assert authenticated_user.email == user.email
 
 
-@pytest.mark.asyncio
 async def test_authenticate_user_invalid_email(
     db_session: AsyncSession,
 ) -> None:
@@ -100,7 +96,6 @@ async def test_authenticate_user_invalid_email(
         await auth_service.authenticate_user(user_data)
 
 
-@pytest.mark.asyncio
 async def test_authenticate_user_invalid_password(
     db_session: AsyncSession,
 ) -> None:
@@ -127,21 +122,14 @@ async def test_authenticate_user_invalid_password(
         await auth_service.authenticate_user(user_data)
 
 
-@pytest.mark.asyncio
-async def test_create_token_success(db_session: AsyncSession) -> None:
+async def test_create_token_success(
+    db_session: AsyncSession,
+    make_user_and_token: Callable[..., Awaitable[tuple[User, Token]]],
+) -> None:
     """Test successful token creation."""
     auth_service = AuthService(db_session)
 
-    user = User(
-        name="Test User",
-        email="test@example.com",
-        hashed_password=hash_password("SecurePass123"),
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
-    token = auth_service.create_token(user)
+    user, token = await make_user_and_token(auth_service)
 
     assert token.access_token is not None
     assert token.token_type == "Bearer"
@@ -160,24 +148,18 @@ async def test_create_token_success(db_session: AsyncSession) -> None:
     assert "exp" in payload
 
 
-@pytest.mark.asyncio
 async def test_create_token_with_custom_expires_delta(
     db_session: AsyncSession,
+    make_user_and_token: Callable[..., Awaitable[tuple[User, Token]]],
 ) -> None:
     """Test token creation with custom expiration time."""
     auth_service = AuthService(db_session)
 
-    user = User(
-        name="Test User",
-        email="test@example.com",
-        hashed_password=hash_password("SecurePass123"),
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
     custom_delta = timedelta(minutes=60)
-    token = auth_service.create_token(user, expires_delta=custom_delta)
+    user, token = await make_user_and_token(
+        auth_service,
+        expires_delta=custom_delta,
+    )
 
     # Verify token can be decoded
     payload = jwt.decode(
@@ -199,7 +181,6 @@ async def test_create_token_with_custom_expires_delta(
     assert abs((actual_exp - expected_exp).total_seconds()) < 5
 
 
-@pytest.mark.asyncio
 async def test_login_success(db_session: AsyncSession) -> None:
     """Test successful login."""
     auth_service = AuthService(db_session)
@@ -213,7 +194,6 @@ async def test_login_success(db_session: AsyncSession) -> None:
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Login
     user_data = UserLogin(
@@ -237,7 +217,6 @@ async def test_login_success(db_session: AsyncSession) -> None:
     assert payload["sub"] == user.email
 
 
-@pytest.mark.asyncio
 async def test_login_invalid_credentials(db_session: AsyncSession) -> None:
     """Test login with invalid credentials fails."""
     auth_service = AuthService(db_session)
@@ -251,23 +230,14 @@ async def test_login_invalid_credentials(db_session: AsyncSession) -> None:
         await auth_service.login(user_data)
 
 
-@pytest.mark.asyncio
-async def test_get_user_from_token_success(db_session: AsyncSession) -> None:
+async def test_get_user_from_token_success(
+    db_session: AsyncSession,
+    make_user_and_token: Callable[..., Awaitable[tuple[User, Token]]],
+) -> None:
     """Test getting user from valid token."""
     auth_service = AuthService(db_session)
 
-    # Create a user
-    user = User(
-        name="Test User",
-        email="test@example.com",
-        hashed_password=hash_password("SecurePass123"),
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
-    # Create a token
-    token = auth_service.create_token(user)
+    user, token = await make_user_and_token(auth_service)
 
     # Get user from token
     retrieved_user = await auth_service.get_user_from_token(token.access_token)
@@ -277,7 +247,6 @@ async def test_get_user_from_token_success(db_session: AsyncSession) -> None:
     assert retrieved_user.name == user.name
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_invalid_token(
     db_session: AsyncSession,
 ) -> None:
@@ -290,7 +259,6 @@ async def test_get_user_from_token_invalid_token(
         await auth_service.get_user_from_token(invalid_token)
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_missing_subject(
     db_session: AsyncSession,
 ) -> None:
@@ -304,7 +272,6 @@ async def test_get_user_from_token_missing_subject(
             "iss": settings.jwt_issuer,
             "aud": settings.jwt_audience,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -315,7 +282,6 @@ async def test_get_user_from_token_missing_subject(
     assert "Token missing subject" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_user_not_found(
     db_session: AsyncSession,
 ) -> None:
@@ -330,7 +296,6 @@ async def test_get_user_from_token_user_not_found(
             "iss": settings.jwt_issuer,
             "aud": settings.jwt_audience,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -341,7 +306,6 @@ async def test_get_user_from_token_user_not_found(
     assert "not found" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_expired_token(
     db_session: AsyncSession,
 ) -> None:
@@ -357,7 +321,6 @@ async def test_get_user_from_token_expired_token(
             "iss": settings.jwt_issuer,
             "aud": settings.jwt_audience,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -366,23 +329,14 @@ async def test_get_user_from_token_expired_token(
         await auth_service.get_user_from_token(expired_token)
 
 
-@pytest.mark.asyncio
-async def test_validate_token_success(db_session: AsyncSession) -> None:
+async def test_validate_token_success(
+    db_session: AsyncSession,
+    make_user_and_token: Callable[..., Awaitable[tuple[User, Token]]],
+) -> None:
     """Test token validation with valid token."""
     auth_service = AuthService(db_session)
 
-    # Create a user
-    user = User(
-        name="Test User",
-        email="test@example.com",
-        hashed_password=hash_password("SecurePass123"),
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
-    # Create a token
-    token = auth_service.create_token(user)
+    user, token = await make_user_and_token(auth_service)
 
     # Validate token
     is_valid, retrieved_user = await auth_service.validate_token(
@@ -395,7 +349,6 @@ async def test_validate_token_success(db_session: AsyncSession) -> None:
     assert retrieved_user.email == user.email
 
 
-@pytest.mark.asyncio
 async def test_validate_token_invalid_token(db_session: AsyncSession) -> None:
     """Test token validation with invalid token."""
     auth_service = AuthService(db_session)
@@ -408,7 +361,6 @@ async def test_validate_token_invalid_token(db_session: AsyncSession) -> None:
     assert user is None
 
 
-@pytest.mark.asyncio
 async def test_validate_token_expired_token(db_session: AsyncSession) -> None:
     """Test token validation with expired token."""
     auth_service = AuthService(db_session)
@@ -421,7 +373,6 @@ async def test_validate_token_expired_token(db_session: AsyncSession) -> None:
             "iss": settings.jwt_issuer,
             "aud": settings.jwt_audience,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -432,7 +383,6 @@ async def test_validate_token_expired_token(db_session: AsyncSession) -> None:
     assert user is None
 
 
-@pytest.mark.asyncio
 async def test_validate_token_user_not_found(db_session: AsyncSession) -> None:
     """Test token validation when user doesn't exist."""
     auth_service = AuthService(db_session)
@@ -445,7 +395,6 @@ async def test_validate_token_user_not_found(db_session: AsyncSession) -> None:
             "iss": settings.jwt_issuer,
             "aud": settings.jwt_audience,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -456,7 +405,6 @@ async def test_validate_token_user_not_found(db_session: AsyncSession) -> None:
     assert user is None
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_wrong_issuer(
     db_session: AsyncSession,
 ) -> None:
@@ -471,7 +419,6 @@ async def test_get_user_from_token_wrong_issuer(
             "iss": "wrong-issuer",
             "aud": settings.jwt_audience,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -482,7 +429,6 @@ async def test_get_user_from_token_wrong_issuer(
     assert "issuer" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_wrong_audience(
     db_session: AsyncSession,
 ) -> None:
@@ -497,7 +443,6 @@ async def test_get_user_from_token_wrong_audience(
             "iss": settings.jwt_issuer,
             "aud": "wrong-audience",
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -508,7 +453,6 @@ async def test_get_user_from_token_wrong_audience(
     assert "audience" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_missing_issuer(
     db_session: AsyncSession,
 ) -> None:
@@ -522,7 +466,6 @@ async def test_get_user_from_token_missing_issuer(
             "exp": 9999999999,
             "aud": settings.jwt_audience,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -533,7 +476,6 @@ async def test_get_user_from_token_missing_issuer(
     assert "issuer" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_missing_audience(
     db_session: AsyncSession,
 ) -> None:
@@ -547,7 +489,6 @@ async def test_get_user_from_token_missing_audience(
             "exp": 9999999999,
             "iss": settings.jwt_issuer,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -558,23 +499,14 @@ async def test_get_user_from_token_missing_audience(
     assert "audience" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
 async def test_create_token_includes_issuer_audience(
     db_session: AsyncSession,
+    make_user_and_token: Callable[..., Awaitable[tuple[User, Token]]],
 ) -> None:
     """Test that created tokens include issuer and audience claims."""
     auth_service = AuthService(db_session)
 
-    user = User(
-        name="Test User",
-        email="test@example.com",
-        hashed_password=hash_password("SecurePass123"),
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
-    token = auth_service.create_token(user)
+    user, token = await make_user_and_token(auth_service)
 
     # Verify token can be decoded and contains issuer/audience
     payload = jwt.decode(
@@ -591,7 +523,6 @@ async def test_create_token_includes_issuer_audience(
     assert "exp" in payload
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_expired_within_leeway(
     db_session: AsyncSession,
 ) -> None:
@@ -606,7 +537,6 @@ async def test_get_user_from_token_expired_within_leeway(
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Create token expired 60s ago (within default 120s leeway)
     expired_token = jwt.encode(
@@ -616,7 +546,6 @@ async def test_get_user_from_token_expired_within_leeway(
             "iss": settings.jwt_issuer,
             "aud": settings.jwt_audience,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -627,7 +556,6 @@ async def test_get_user_from_token_expired_within_leeway(
     assert retrieved_user.email == user.email
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_expired_beyond_leeway(
     db_session: AsyncSession,
 ) -> None:
@@ -642,7 +570,6 @@ async def test_get_user_from_token_expired_beyond_leeway(
             "iss": settings.jwt_issuer,
             "aud": settings.jwt_audience,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -652,7 +579,6 @@ async def test_get_user_from_token_expired_beyond_leeway(
         await auth_service.get_user_from_token(expired_token)
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_nbf_within_leeway(
     db_session: AsyncSession,
 ) -> None:
@@ -667,7 +593,6 @@ async def test_get_user_from_token_nbf_within_leeway(
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Create token with nbf 60s in future (within default 120s leeway)
     future_token = jwt.encode(
@@ -678,7 +603,6 @@ async def test_get_user_from_token_nbf_within_leeway(
             "iss": settings.jwt_issuer,
             "aud": settings.jwt_audience,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -689,7 +613,6 @@ async def test_get_user_from_token_nbf_within_leeway(
     assert retrieved_user.email == user.email
 
 
-@pytest.mark.asyncio
 async def test_get_user_from_token_nbf_beyond_leeway(
     db_session: AsyncSession,
 ) -> None:
@@ -705,7 +628,6 @@ async def test_get_user_from_token_nbf_beyond_leeway(
             "iss": settings.jwt_issuer,
             "aud": settings.jwt_audience,
         },
-        # pylint: disable=no-member
         settings.jwt_secret_key.get_secret_value(),
         algorithm=settings.jwt_algorithm,
     )
@@ -1,5 +1,6 @@
 """Tests for CLI commands."""
 
+from collections.abc import Iterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -12,39 +13,64 @@ from src.cli import _create_superuser
 from src.core.security import hash_password, verify_password
 from src.models.user import User
 
+# pylint: disable=redefined-outer-name
 
-@pytest.mark.asyncio
-async def test_create_superuser_new_user_success(
-    db_session: AsyncSession,
-) -> None:
-    """Test creating a new superuser successfully."""
-    email = "admin@example.com"
-    name = "Admin User"
-    password = "SecurePass123"
 
-    # Mock the session factory to return our test session
+@pytest.fixture
+def mock_session_factory() -> Iterator[MagicMock]:
+    """Patch the CLI session factory.
+
+    Set the session it hands out on ``return_value.__aenter__.return_value``.
+    """
     with patch("src.cli.async_session_factory") as mock_factory:
         mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
+        mock_context.__aenter__ = AsyncMock()
         mock_context.__aexit__ = AsyncMock(return_value=None)
         mock_factory.return_value = mock_context
+        yield mock_factory
 
-        await _create_superuser(email, name, password)
 
-    # Verify user was created
-    result = await db_session.execute(
-        select(User).where(User.email == email),
-    )
-    user = result.scalar_one_or_none()
+@pytest.fixture
+def patched_session_factory(
+    db_session: AsyncSession,
+    mock_session_factory: MagicMock,
+) -> MagicMock:
+    """Patch the CLI session factory to hand out the test session."""
+    mock_session_factory.return_value.__aenter__.return_value = db_session
+    return mock_session_factory
+
+
+@pytest.mark.usefixtures("patched_session_factory")
+@pytest.mark.parametrize(
+    ("email", "name", "password"),
+    [
+        ("admin@example.com", "Admin User", "SecurePass123"),
+        ("test@example.com", "测试用户 🧙‍♂️", "SecurePass123"),
+        ("test+unicode@example.com", "Test User", "SecurePass123"),
+    ],
+    ids=["new_user", "unicode_name", "unicode_email"],
+)
+async def test_create_superuser_variants(
+    db_session: AsyncSession,
+    email: str,
+    name: str,
+    password: str,
+) -> None:
+    """Test creating a new superuser across name/email variants."""
+    await _create_superuser(email, name, password)
+
+    user = await db_session.scalar(select(User).where(User.email == email))
 
     assert user is not None
     assert user.email == email
     assert user.name == name
     assert user.is_superuser is True
+    # Password should be hashed, not plain text
+    assert user.hashed_password != password
     assert verify_password(password, user.hashed_password)
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("patched_session_factory")
 async def test_create_superuser_existing_user_promotes(
     db_session: AsyncSession,
 ) -> None:
@@ -63,22 +89,15 @@ async def test_create_superuser_existing_user_promotes(
     db_session.add(user)
     await db_session.commit()
 
-    # Mock the session factory to return our test session
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        # Promote to superuser
-        await _create_superuser(email, name, password)
+    # Promote to superuser
+    await _create_superuser(email, name, password)
 
     # Verify user is now superuser
     await db_session.refresh(user)
     assert user.is_superuser is True
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("patched_session_factory")
 async def test_create_superuser_existing_superuser_no_change(
     db_session: AsyncSession,
 ) -> None:
@@ -98,15 +117,8 @@ async def test_create_superuser_existing_superuser_no_change(
     await db_session.commit()
     original_id = user.id
 
-    # Mock the session factory to return our test session
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        # Try to create again
-        await _create_superuser(email, name, password)
+    # Try to create again
+    await _create_superuser(email, name, password)
 
     # Verify user still exists and is still superuser
     await db_session.refresh(user)
@@ -114,128 +126,88 @@ async def test_create_superuser_existing_superuser_no_change(
     assert user.is_superuser is True
 
 
-@pytest.mark.asyncio
-async def test_create_superuser_invalid_email(
-    db_session: AsyncSession,
-) -> None:
+@pytest.mark.usefixtures("patched_session_factory")
+async def test_create_superuser_invalid_email() -> None:
     """Test creating superuser with invalid email raises ValidationError."""
     email = "not-an-email"
     name = "Test User"
     password = "SecurePass123"
 
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        with pytest.raises(Exit):
-            await _create_superuser(email, name, password)
+    with pytest.raises(Exit):
+        await _create_superuser(email, name, password)
 
 
-@pytest.mark.asyncio
-async def test_create_superuser_invalid_password_too_short(
-    db_session: AsyncSession,
-) -> None:
+@pytest.mark.usefixtures("patched_session_factory")
+async def test_create_superuser_invalid_password_too_short() -> None:
     """Test creating superuser with password too short raises ValidationError."""
     email = "test@example.com"
     name = "Test User"
     password = "short"  # Too short
 
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        with pytest.raises(Exit):
-            await _create_superuser(email, name, password)
+    with pytest.raises(Exit):
+        await _create_superuser(email, name, password)
 
 
-@pytest.mark.asyncio
-async def test_create_superuser_invalid_password_no_digit(
-    db_session: AsyncSession,
-) -> None:
+@pytest.mark.usefixtures("patched_session_factory")
+async def test_create_superuser_invalid_password_no_digit() -> None:
     """Test creating superuser with password without digit raises ValidationError."""
     email = "test@example.com"
     name = "Test User"
     password = "NoDigitPassword"  # No digit
 
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        with pytest.raises(Exit):
-            await _create_superuser(email, name, password)
+    with pytest.raises(Exit):
+        await _create_superuser(email, name, password)
 
 
-@pytest.mark.asyncio
-async def test_create_superuser_password_too_long(
-    db_session: AsyncSession,
-) -> None:
+@pytest.mark.usefixtures("patched_session_factory")
+async def test_create_superuser_password_too_long() -> None:
     """Test creating superuser with password exceeding 72 bytes."""
     email = "test@example.com"
     name = "Test User"
     password = "a" * 73  # Exceeds 72 bytes
 
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        with pytest.raises(Exit):
-            await _create_superuser(email, name, password)
+    with pytest.raises(Exit):
+        await _create_superuser(email, name, password)
 
 
-@pytest.mark.asyncio
-async def test_create_superuser_empty_name(db_session: AsyncSession) -> None:
+@pytest.mark.usefixtures("patched_session_factory")
+async def test_create_superuser_empty_name() -> None:
     """Test creating superuser with empty name raises ValidationError."""
     email = "test@example.com"
     name = ""
     password = "SecurePass123"
 
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        with pytest.raises(Exit):
-            await _create_superuser(email, name, password)
+    with pytest.raises(Exit):
+        await _create_superuser(email, name, password)
 
 
-@pytest.mark.asyncio
-async def test_create_superuser_integrity_error_handling() -> None:
+async def test_create_superuser_integrity_error_handling(
+    mock_session_factory: MagicMock,
+) -> None:
     """Test handling of database integrity errors."""
     email = "test@example.com"
     name = "Test User"
     password = "SecurePass123"
 
     # Mock session to raise IntegrityError
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_session.execute = AsyncMock()
-        mock_session.execute.return_value.scalar_one_or_none.return_value = None
-        mock_session.commit = AsyncMock(
-            side_effect=IntegrityError(None, None, Exception("Mock"))
-        )
-        mock_session.rollback = AsyncMock()
-
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
+    mock_session = AsyncMock()
+    mock_session.execute = AsyncMock(return_value=MagicMock())
+    mock_session.execute.return_value.scalar_one_or_none.return_value = None
+    mock_session.add = MagicMock()
+    mock_session.commit = AsyncMock(
+        side_effect=IntegrityError(None, None, Exception("Mock"))
+    )
+    mock_session.rollback = AsyncMock()
+    mock_session_factory.return_value.__aenter__.return_value = mock_session
 
-        with pytest.raises(Exit):
-            await _create_superuser(email, name, password)
+    with pytest.raises(Exit):
+        await _create_superuser(email, name, password)
 
-        mock_session.rollback.assert_called_once()
+    mock_session.commit.assert_awaited_once()
+    mock_session.rollback.assert_called_once()
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("patched_session_factory")
 async def test_create_superuser_updates_name_if_different(
     db_session: AsyncSession,
 ) -> None:
@@ -255,15 +227,8 @@ async def test_create_superuser_updates_name_if_different(
     db_session.add(user)
     await db_session.commit()
 
-    # Mock the session factory to return our test session
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        # Create superuser with new name
-        await _create_superuser(email, new_name, password)
+    # Create superuser with new name
+    await _create_superuser(email, new_name, password)
 
     # Verify user is superuser (note: CLI doesn't update name when promoting)
     await db_session.refresh(user)
@@ -272,112 +237,29 @@ async def test_create_superuser_updates_name_if_different(
     # creating new. So we just verify the user was promoted.
 
 
-@pytest.mark.asyncio
-async def test_create_superuser_password_hashing(
-    db_session: AsyncSession,
+async def test_create_superuser_exception_handling(
+    mock_session_factory: MagicMock,
 ) -> None:
-    """Test that password is properly hashed when creating superuser."""
-    email = "test@example.com"
-    name = "Test User"
-    password = "SecurePass123"
-
-    # Mock the session factory to return our test session
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        await _create_superuser(email, name, password)
-
-    result = await db_session.execute(
-        select(User).where(User.email == email),
-    )
-    user = result.scalar_one_or_none()
-
-    assert user is not None
-    # Password should be hashed, not plain text
-    assert user.hashed_password != password
-    assert verify_password(password, user.hashed_password)
-
-
-@pytest.mark.asyncio
-async def test_create_superuser_unicode_name(db_session: AsyncSession) -> None:
-    """Test creating superuser with unicode characters in name."""
-    email = "test@example.com"
-    name = "测试用户 🧙‍♂️"
-    password = "SecurePass123"
-
-    # Mock the session factory to return our test session
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        await _create_superuser(email, name, password)
-
-    result = await db_session.execute(
-        select(User).where(User.email == email),
-    )
-    user = result.scalar_one_or_none()
-
-    assert user is not None
-    assert user.name == name
-
-
-@pytest.mark.asyncio
-async def test_create_superuser_unicode_email(db_session: AsyncSession) -> None:
-    """Test creating superuser with unicode characters in email."""
-    email = "test+unicode@example.com"
-    name = "Test User"
-    password = "SecurePass123"
-
-    # Mock the session factory to return our test session
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        await _create_superuser(email, name, password)
-
-    result = await db_session.execute(
-        select(User).where(User.email == email),
-    )
-    user = result.scalar_one_or_none()
-
-    assert user is not None
-    assert user.email == email
-
-
-@pytest.mark.asyncio
-async def test_create_superuser_exception_handling() -> None:
     """Test that unexpected exceptions are properly handled."""
     email = "test@example.com"
     name = "Test User"
     password = "SecurePass123"
 
     # Mock session to raise unexpected exception
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_session.execute = AsyncMock(
-            side_effect=Exception("Unexpected error")
-        )
-        mock_session.rollback = AsyncMock()
-
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
+    mock_session = AsyncMock()
+    mock_session.execute = AsyncMock(
+        side_effect=Exception("Unexpected error")
+    )
+    mock_session.rollback = AsyncMock()
+    mock_session_factory.return_value.__aenter__.return_value = mock_session
 
-        with pytest.raises(Exit):
-            await _create_superuser(email, name, password)
+    with pytest.raises(Exit):
+        await _create_superuser(email, name, password)
 
-        mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_called_once()
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("patched_session_factory")
 async def test_create_superuser_password_exactly_72_bytes(
     db_session: AsyncSession,
 ) -> None:
@@ -387,19 +269,9 @@ async def test_create_superuser_password_exactly_72_bytes(
     # Password with digit, exactly 72 bytes
     password = "a" * 71 + "1"  # 71 'a' + 1 digit = 72 bytes
 
-    # Mock the session factory to return our test session
-    with patch("src.cli.async_session_factory") as mock_factory:
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=db_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_factory.return_value = mock_context
-
-        await _create_superuser(email, name, password)
+    await _create_superuser(email, name, password)
 
-    result = await db_session.execute(
-        select(User).where(User.email == email),
-    )
-    user = result.scalar_one_or_none()
+    user = await db_session.scalar(select(User).where(User.email == email))
 
     assert user is not None
     assert verify_password(password, user.hashed_password)
@@ -1,13 +1,13 @@
 """Tests for configuration settings."""
 
 import os
-import secrets
+from collections.abc import Iterator
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Final
+from unittest.mock import patch
 
 import pytest
-from pydantic import ValidationError
-from pydantic_settings import BaseSettings
+from pydantic import HttpUrl, SecretStr, ValidationError
 
 from src.core.config import (
     PROJECT_INFO,
@@ -16,6 +16,78 @@ from src.core.config import (
 )
 
 
+# Keep the module on one xdist worker so the module-scoped environment and
+# settings fixtures are built once.
+pytestmark = pytest.mark.xdist_group("config")
+
+_BASE_ENV: Final[dict[str, str]] = {
+    "LOGFIRE_TOKEN": "test_token",
+    "DATABASE_USER": "test_user",
+    "DATABASE_PASSWORD": "test_pass",
+    "DATABASE_HOST": "localhost",
+    "DATABASE_PORT": "5432",
+    "DATABASE_NAME": "test_db",
+    "REDIS_PASSWORD": "redis_pass",
+}
+
+_CUSTOM_ENV: Final[dict[str, str]] = {
+    "LOGFIRE_TOKEN": "custom_token",
+    "DATABASE_USER": "custom_user",
+    "DATABASE_PASSWORD": "custom_pass",
+    "DATABASE_HOST": "custom_host",
+    "DATABASE_PORT": "5433",
+    "DATABASE_NAME": "custom_db",
+    "REDIS_PASSWORD": "custom_redis_pass",
+    "REDIS_HOST": "custom_redis_host",
+    "JWT_ALGORITHM": "HS512",
+    "DEBUG": "true",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "60",
+    "LITELLM_BASE_URL": "https://api.example.com",
+    "ENVIRONMENT": "production",
+}
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _base_env() -> Iterator[None]:
+    """Set the base environment once for every test in this module.
+
+    Tests override individual keys with ``monkeypatch.setenv``, which restores
+    the base value afterwards.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in _BASE_ENV.items():
+            mp.setenv(key, value)
+        yield
+
+
+@pytest.fixture(scope="module")
+def default_settings() -> Settings:
+    """Build Settings with only the required fields, skipping validation.
+
+    ``model_construct`` neither reads the environment nor runs validators, so
+    every other field holds its declared default. Tests that need different
+    values should derive from this instance with ``model_copy(update=...)``.
+    """
+    return Settings.model_construct(
+        logfire_token=SecretStr("test_token"),
+        database_user="test_user",
+        database_password=SecretStr("test_pass"),
+        database_host="localhost",
+        database_port=5432,
+        database_name="test_db",
+        redis_password=SecretStr("redis_pass"),
+    )
+
+
+@pytest.fixture(scope="module")
+def custom_settings(_base_env: None) -> Settings:
+    """Build Settings once with every overridable field set from the environment."""
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in _CUSTOM_ENV.items():
+            mp.setenv(key, value)
+        return Settings()
+
+
 class TestLoadProjectInfo:
     """Tests for load_project_info function."""
 
@@ -36,6 +108,7 @@ class TestLoadProjectInfo:
 
     def test_load_project_info_file_not_found(self, tmp_path: Path) -> None:
         """Test that FileNotFoundError is raised when pyproject.toml doesn't exist."""
+        load_project_info.cache_clear()
         with patch("src.core.config.parent_dir", tmp_path):
             with pytest.raises(FileNotFoundError) as exc_info:
                 load_project_info()
@@ -52,266 +125,129 @@ class TestLoadProjectInfo:
 class TestSettings:
     """Tests for Settings class."""
 
-    def test_settings_defaults(self) -> None:
+    def test_settings_defaults(self, default_settings: Settings) -> None:
         """Test that Settings has correct default values."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            assert settings.jwt_algorithm == "HS256"
-            assert settings.debug is False
-            assert settings.access_token_expire_minutes == 30
-            assert settings.redis_host == "localhost"
-            assert settings.allowed_origins == "*"
-
-    def test_jwt_secret_key_default_factory(self) -> None:
+        assert default_settings.jwt_algorithm == "HS256"
+        assert default_settings.debug is False
+        assert default_settings.access_token_expire_minutes == 30
+        assert default_settings.redis_host == "localhost"
+        assert default_settings.allowed_origins == "*"
+
+    def test_jwt_secret_key_default_factory(self, default_settings: Settings) -> None:
         """Test that JWT secret key is generated if not provided."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            assert settings.jwt_secret_key is not None
-            assert len(settings.jwt_secret_key.get_secret_value()) > 0
+        assert default_settings.jwt_secret_key is not None
+        assert len(default_settings.jwt_secret_key.get_secret_value()) > 0
 
-    def test_jwt_algorithm_validation_valid(self) -> None:
+    def test_jwt_algorithm_validation_valid(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test that valid JWT algorithms are accepted."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-                "JWT_ALGORITHM": "HS256",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            assert settings.jwt_algorithm == "HS256"
+        monkeypatch.setenv("JWT_ALGORITHM", "HS256")
+        settings = Settings()
+        assert settings.jwt_algorithm == "HS256"
 
-    def test_jwt_algorithm_validation_invalid(self) -> None:
+    def test_jwt_algorithm_validation_invalid(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test that invalid JWT algorithms raise ValidationError."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-                "JWT_ALGORITHM": "INVALID_ALGORITHM",
-            },
-            clear=False,
-        ):
-            with pytest.raises(ValidationError) as exc_info:
-                Settings()
-            assert "Invalid JWT algorithm" in str(exc_info.value)
+        monkeypatch.setenv("JWT_ALGORITHM", "INVALID_ALGORITHM")
+        with pytest.raises(ValidationError) as exc_info:
+            Settings()
+        assert "Invalid JWT algorithm" in str(exc_info.value)
 
-    def test_redis_url_property(self) -> None:
+    def test_redis_url_property(self, default_settings: Settings) -> None:
         """Test that redis_url property builds correct URL."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass123",
-                "REDIS_HOST": "redis.example.com",
+        settings = default_settings.model_copy(
+            update={
+                "redis_password": SecretStr("redis_pass123"),
+                "redis_host": "redis.example.com",
             },
-            clear=False,
-        ):
-            settings = Settings()
-            redis_url = settings.redis_url
-            assert str(redis_url).startswith("redis://")
-            assert "redis.example.com" in str(redis_url)
-            assert ":6379" in str(redis_url)
-
-    def test_redis_url_default_host(self) -> None:
+        )
+        redis_url = settings.redis_url
+        assert str(redis_url).startswith("redis://")
+        assert "redis.example.com" in str(redis_url)
+        assert ":6379" in str(redis_url)
+
+    def test_redis_url_default_host(self, default_settings: Settings) -> None:
         """Test that redis_url uses default host when not provided."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            redis_url = settings.redis_url
-            assert "localhost" in str(redis_url)
+        redis_url = default_settings.redis_url
+        assert "localhost" in str(redis_url)
 
-    def test_database_url_property(self) -> None:
+    def test_database_url_property(self, default_settings: Settings) -> None:
         """Test that database_url property builds correct URL."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "db.example.com",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            db_url = settings.database_url
-            assert str(db_url).startswith("postgresql+asyncpg://")
-            assert "test_user" in str(db_url)
-            assert "db.example.com" in str(db_url)
-            assert "/test_db" in str(db_url)
-
-    def test_allowed_origins_list_wildcard(self) -> None:
-        """Test that allowed_origins_list returns ['*'] for wildcard."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-                "ALLOWED_ORIGINS": "*",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            origins = settings.allowed_origins_list
-            assert origins == ["*"]
-
-    def test_allowed_origins_list_multiple(self) -> None:
-        """Test that allowed_origins_list splits comma-separated values."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-                "ALLOWED_ORIGINS": "http://localhost:3000,https://example.com",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            origins = settings.allowed_origins_list
-            assert len(origins) == 2
-            assert "http://localhost:3000" in origins
-            assert "https://example.com" in origins
-
-    def test_allowed_origins_list_strips_whitespace(self) -> None:
-        """Test that allowed_origins_list strips whitespace from values."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-                "ALLOWED_ORIGINS": " http://localhost:3000 , https://example.com ",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            origins = settings.allowed_origins_list
-            assert "http://localhost:3000" in origins
-            assert "https://example.com" in origins
-            assert all(not origin.startswith(" ") for origin in origins)
-            assert all(not origin.endswith(" ") for origin in origins)
-
-    def test_allowed_origins_list_filters_empty(self) -> None:
-        """Test that allowed_origins_list filters out empty values."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-                "ALLOWED_ORIGINS": "http://localhost:3000,,https://example.com",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            origins = settings.allowed_origins_list
-            assert len(origins) == 2
-            assert "" not in origins
-
-    def test_environment_variable_loading(self) -> None:
+        settings = default_settings.model_copy(
+            update={"database_host": "db.example.com"},
+        )
+        db_url = settings.database_url
+        assert str(db_url).startswith("postgresql+asyncpg://")
+        assert "test_user" in str(db_url)
+        assert "db.example.com" in str(db_url)
+        assert "/test_db" in str(db_url)
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            pytest.param("*", ["*"], id="wildcard"),
+            pytest.param(
+                "http://localhost:3000,https://example.com",
+                ["http://localhost:3000", "https://example.com"],
+                id="multiple",
+            ),
+            pytest.param(
+                " http://localhost:3000 , https://example.com ",
+                ["http://localhost:3000", "https://example.com"],
+                id="strips-whitespace",
+            ),
+            pytest.param(
+                "http://localhost:3000,,https://example.com",
+                ["http://localhost:3000", "https://example.com"],
+                id="filters-empty",
+            ),
+        ],
+    )
+    def test_allowed_origins_list(
+        self,
+        default_settings: Settings,
+        raw: str,
+        expected: list[str],
+    ) -> None:
+        """Test that allowed_origins_list splits, strips and filters values."""
+        settings = default_settings.model_copy(update={"allowed_origins": raw})
+        assert settings.allowed_origins_list == expected
+
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("logfire_token", "custom_token"),
+            ("database_user", "custom_user"),
+            ("database_password", "custom_pass"),
+            ("database_host", "custom_host"),
+            ("database_port", 5433),
+            ("database_name", "custom_db"),
+            ("redis_password", "custom_redis_pass"),
+            ("redis_host", "custom_redis_host"),
+            ("jwt_algorithm", "HS512"),
+            ("debug", True),
+            ("access_token_expire_minutes", 60),
+            ("litellm_base_url", "https://api.example.com/"),
+            ("environment", "production"),
+        ],
+    )
+    def test_environment_variable_loading(
+        self,
+        custom_settings: Settings,
+        attr: str,
+        expected: object,
+    ) -> None:
         """Test that environment variables are loaded correctly."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "custom_token",
-                "DATABASE_USER": "custom_user",
-                "DATABASE_PASSWORD": "custom_pass",
-                "DATABASE_HOST": "custom_host",
-                "DATABASE_PORT": "5433",
-                "DATABASE_NAME": "custom_db",
-                "REDIS_PASSWORD": "custom_redis_pass",
-                "REDIS_HOST": "custom_redis_host",
-                "JWT_ALGORITHM": "HS512",
-                "DEBUG": "true",
-                "ACCESS_TOKEN_EXPIRE_MINUTES": "60",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            assert settings.logfire_token.get_secret_value() == "custom_token"
-            assert settings.database_user == "custom_user"
-            assert settings.database_password.get_secret_value() == "custom_pass"
-            assert settings.database_host == "custom_host"
-            assert settings.database_port == 5433
-            assert settings.database_name == "custom_db"
-            assert settings.redis_password.get_secret_value() == "custom_redis_pass"
-            assert settings.redis_host == "custom_redis_host"
-            assert settings.jwt_algorithm == "HS512"
-            assert settings.debug is True
-            assert settings.access_token_expire_minutes == 60
+        value = getattr(custom_settings, attr)
+        if isinstance(value, SecretStr):
+            value = value.get_secret_value()
+        elif isinstance(value, HttpUrl):
+            value = str(value)
+        assert value == expected
 
     def test_required_fields_missing(self) -> None:
         """Test that missing required fields raise ValidationError."""
@@ -329,85 +265,15 @@ class TestSettings:
                 # This is expected if no env files exist
                 pass
 
-    def test_litellm_base_url_default(self) -> None:
+    def test_litellm_base_url_default(self, default_settings: Settings) -> None:
         """Test that litellm_base_url has correct default."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            # HttpUrl may add trailing slash, so check that it contains the base URL
-            assert "localhost:4000" in str(settings.litellm_base_url)
-            assert str(settings.litellm_base_url).startswith("http://")
-
-    def test_litellm_base_url_custom(self) -> None:
-        """Test that litellm_base_url can be set from environment."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-                "LITELLM_BASE_URL": "https://api.example.com",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            assert "api.example.com" in str(settings.litellm_base_url)
-
-    def test_environment_field(self) -> None:
-        """Test that environment field is set correctly."""
-        with patch.dict(
-            os.environ,
-            {
-                "ENVIRONMENT": "production",
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-            },
-            clear=False,
-        ):
-            settings = Settings()
-            assert settings.environment == "production"
+        # HttpUrl may add trailing slash, so check that it contains the base URL
+        assert "localhost:4000" in str(default_settings.litellm_base_url)
+        assert str(default_settings.litellm_base_url).startswith("http://")
 
-    def test_environment_default(self) -> None:
+    def test_environment_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that environment defaults to development."""
-        with patch.dict(
-            os.environ,
-            {
-                "LOGFIRE_TOKEN": "test_token",
-                "DATABASE_USER": "test_user",
-                "DATABASE_PASSWORD": "test_pass",
-                "DATABASE_HOST": "localhost",
-                "DATABASE_PORT": "5432",
-                "DATABASE_NAME": "test_db",
-                "REDIS_PASSWORD": "redis_pass",
-            },
-            clear=False,
-        ):
-            # Remove ENVIRONMENT if it exists
-            env_backup = os.environ.pop("ENVIRONMENT", None)
-            try:
-                settings = Settings()
-                # Should default to "development" (lowercase)
-                assert settings.environment in ["development", "production", "test"]
-            finally:
-                if env_backup:
-                    os.environ["ENVIRONMENT"] = env_backup
+        monkeypatch.delenv("ENVIRONMENT", raising=False)
+        settings = Settings()
+        # Should default to "development" (lowercase)
+        assert settings.environment in ["development", "production", "test"]
@@ -1,15 +1,17 @@
 """Tests for prompt service."""
 
 import uuid
+from collections.abc import Awaitable, Callable
 from typing import cast
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 from redis.asyncio import Redis
-from sqlalchemy import select
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.prompt import Prompt, PromptVersion
+from src.models.user import User
 from src.services.prompt_service import (
     PromptNotFoundError,
     PromptService,
@@ -18,20 +20,30 @@ from src.services.prompt_service import (
 # pylint: disable=redefined-outer-name
 
 
+class _RedisStub:
+    """Stand-in for the Redis client, declaring only the calls the service makes."""
+
+    def __init__(self) -> None:
+        self.get = AsyncMock(return_value=None)
+        self.set = AsyncMock(return_value=True)
+        self.unlink = AsyncMock(return_value=1)
+        self.mget = AsyncMock(return_value=[])
+        pipe = MagicMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        pipe.execute = AsyncMock(return_value=[])
+        self.pipeline = MagicMock(return_value=pipe)
+
+
 @pytest.fixture
-def mock_redis() -> AsyncMock:
+def mock_redis() -> _RedisStub:
     """Create a mock Redis client."""
-    redis = AsyncMock(spec=Redis)
-    redis.get = AsyncMock(return_value=None)
-    redis.set = AsyncMock(return_value=True)
-    redis.delete = AsyncMock(return_value=1)
-    return redis
+    return _RedisStub()
 
 
-@pytest.mark.asyncio
 async def test_get_cached_content_from_cache(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test getting cached content from Redis cache."""
     cached_content = "Cached prompt content"
@@ -48,10 +60,9 @@ async def test_get_cached_content_from_cache(
     mock_redis.set.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_get_cached_content_from_database(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test getting content from database when not in cache."""
     # Create a prompt in the database
@@ -81,10 +92,9 @@ async def test_get_cached_content_from_database(
     )
 
 
-@pytest.mark.asyncio
 async def test_get_cached_content_not_found(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test getting content when prompt doesn't exist."""
     mock_redis.get.return_value = None
@@ -100,10 +110,9 @@ async def test_get_cached_content_not_found(
         )
 
 
-@pytest.mark.asyncio
 async def test_get_cached_content_custom_prefix_and_ttl(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test getting cached content with custom prefix and TTL."""
     prompt = Prompt(
@@ -131,31 +140,147 @@ async def test_get_cached_content_custom_prefix_and_ttl(
     )
 
 
-@pytest.mark.asyncio
+async def test_get_cached_contents_all_cached(
+    db_session: AsyncSession,
+    mock_redis: _RedisStub,
+) -> None:
+    """Test getting several prompts when all are in the cache."""
+    mock_redis.mget.return_value = [b"First content", "Second content"]
+
+    contents = await PromptService.get_cached_contents(
+        db_session,
+        cast(Redis, mock_redis),
+        ["first", "second"],
+    )
+
+    assert contents == {"first": "First content", "second": "Second content"}
+    mock_redis.mget.assert_called_once_with(
+        ["prompt_cache:first", "prompt_cache:second"],
+    )
+    mock_redis.pipeline.assert_not_called()
+
+
+async def test_get_cached_contents_loads_misses(
+    db_session: AsyncSession,
+    mock_redis: _RedisStub,
+) -> None:
+    """Test that cache misses are loaded together and written in one pipeline."""
+    db_session.add_all(
+        [
+            Prompt(slug="second", name="Second", content="Second content"),
+            Prompt(slug="third", name="Third", content="Third content"),
+        ],
+    )
+    await db_session.commit()
+
+    mock_redis.mget.return_value = [b"First content", None, None]
+
+    contents = await PromptService.get_cached_contents(
+        db_session,
+        cast(Redis, mock_redis),
+        ["first", "second", "third", "second"],
+        cache_prefix="custom:",
+        cache_ttl=7200,
+    )
+
+    assert list(contents.items()) == [
+        ("first", "First content"),
+        ("second", "Second content"),
+        ("third", "Third content"),
+    ]
+    mock_redis.mget.assert_called_once_with(
+        ["custom:first", "custom:second", "custom:third"],
+    )
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    pipe = mock_redis.pipeline.return_value
+    assert sorted(pipe.set.call_args_list) == [
+        call("custom:second", "Second content", ex=7200),
+        call("custom:third", "Third content", ex=7200),
+    ]
+    pipe.execute.assert_awaited_once()
+
+
+async def test_get_cached_contents_not_found(
+    db_session: AsyncSession,
+    mock_redis: _RedisStub,
+) -> None:
+    """Test that missing prompts raise without writing to the cache."""
+    db_session.add(Prompt(slug="empty-prompt", name="Empty", content=None))
+    await db_session.commit()
+
+    mock_redis.mget.return_value = [None, None]
+
+    with pytest.raises(
+        PromptNotFoundError,
+        match="Prompt not found: empty-prompt, nonexistent",
+    ):
+        await PromptService.get_cached_contents(
+            db_session,
+            cast(Redis, mock_redis),
+            ["empty-prompt", "nonexistent"],
+        )
+    mock_redis.pipeline.assert_not_called()
+
+
+async def test_get_cached_contents_empty(
+    db_session: AsyncSession,
+    mock_redis: _RedisStub,
+) -> None:
+    """Test that an empty slug list makes no Redis calls."""
+    contents = await PromptService.get_cached_contents(
+        db_session,
+        cast(Redis, mock_redis),
+        [],
+    )
+
+    assert contents == {}
+    mock_redis.mget.assert_not_called()
+
+
 async def test_invalidate_cache(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test invalidating cache for a prompt."""
     service = PromptService(db_session, cast(Redis, mock_redis))
 
     await service.invalidate_cache("test-slug")
 
-    mock_redis.delete.assert_called_once_with("prompt_cache:test-slug")
+    mock_redis.unlink.assert_called_once_with("prompt_cache:test-slug")
+
+
+async def test_invalidate_cache_multiple_slugs(
+    db_session: AsyncSession,
+    mock_redis: _RedisStub,
+) -> None:
+    """Test invalidating several prompts with a single UNLINK."""
+    service = PromptService(db_session, cast(Redis, mock_redis))
+
+    await service.invalidate_cache("first", "second")
+    await service.invalidate_cache()
+
+    mock_redis.unlink.assert_called_once_with(
+        "prompt_cache:first",
+        "prompt_cache:second",
+    )
 
 
-@pytest.mark.asyncio
 async def test_get_all_prompts_for_admin(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
+    bulk_insert: Callable[..., Awaitable[None]],
 ) -> None:
     """Test getting all prompts for admin."""
     # Create multiple prompts
-    prompt1 = Prompt(slug="b-prompt", name="B Prompt", content="Content B")
-    prompt2 = Prompt(slug="a-prompt", name="A Prompt", content="Content A")
-    prompt3 = Prompt(slug="c-prompt", name="C Prompt", content="Content C")
-    db_session.add_all([prompt1, prompt2, prompt3])
-    await db_session.commit()
+    await bulk_insert(
+        db_session,
+        Prompt,
+        [
+            {"slug": "b-prompt", "name": "B Prompt", "content": "Content B"},
+            {"slug": "a-prompt", "name": "A Prompt", "content": "Content A"},
+            {"slug": "c-prompt", "name": "C Prompt", "content": "Content C"},
+        ],
+    )
 
     service = PromptService(db_session, cast(Redis, mock_redis))
     prompts = await service.get_all_prompts_for_admin()
@@ -165,12 +290,14 @@ async def test_get_all_prompts_for_admin(
     assert prompts[0].slug == "a-prompt"
     assert prompts[1].slug == "b-prompt"
     assert prompts[2].slug == "c-prompt"
+    assert prompts[0].name == "A Prompt"
+    # Content is not loaded for the list view
+    assert all("content" in inspect(prompt).unloaded for prompt in prompts)
 
 
-@pytest.mark.asyncio
 async def test_get_all_prompts_for_admin_empty(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test getting all prompts when none exist."""
     service = PromptService(db_session, cast(Redis, mock_redis))
@@ -179,46 +306,60 @@ async def test_get_all_prompts_for_admin_empty(
     assert prompts == []
 
 
-@pytest.mark.asyncio
 async def test_get_prompt_details_for_admin(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
+    bulk_insert: Callable[..., Awaitable[None]],
 ) -> None:
     """Test getting prompt details with versions."""
-    prompt = Prompt(slug="test-slug", name="Test Prompt", content="Content")
-    db_session.add(prompt)
-    await db_session.flush()
-
-    version1 = PromptVersion(
-        prompt_id=prompt.id,
-        version_number=1,
-        content="Version 1",
-        commit_message="Initial version",
-        is_active=True,
+    prompt_id = uuid.uuid4()
+    await bulk_insert(
+        db_session,
+        Prompt,
+        [
+            {
+                "id": prompt_id,
+                "slug": "test-slug",
+                "name": "Test Prompt",
+                "content": "Content",
+            },
+        ],
     )
-    version2 = PromptVersion(
-        prompt_id=prompt.id,
-        version_number=2,
-        content="Version 2",
-        commit_message="Updated version",
-        is_active=False,
+    await bulk_insert(
+        db_session,
+        PromptVersion,
+        [
+            {
+                "prompt_id": prompt_id,
+                "version_number": 1,
+                "content": "Version 1",
+                "commit_message": "Initial version",
+                "is_active": True,
+            },
+            {
+                "prompt_id": prompt_id,
+                "version_number": 2,
+                "content": "Version 2",
+                "commit_message": "Updated version",
+                "is_active": False,
+            },
+        ],
     )
-    db_session.add_all([version1, version2])
-    await db_session.commit()
 
     service = PromptService(db_session, cast(Redis, mock_redis))
-    result = await service.get_prompt_details_for_admin(str(prompt.id))
+    result = await service.get_prompt_details_for_admin(str(prompt_id))
 
     assert result is not None
-    assert result.id == prompt.id
+    assert result.id == prompt_id
     assert result.slug == "test-slug"
-    assert len(result.versions) == 2
+    # Versions are eagerly loaded, newest first
+    assert "versions" not in inspect(result).unloaded
+    assert [v.version_number for v in result.versions] == [2, 1]
 
 
-@pytest.mark.asyncio
 async def test_get_prompt_details_for_admin_not_found(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test getting prompt details when prompt doesn't exist."""
     service = PromptService(db_session, cast(Redis, mock_redis))
@@ -229,10 +370,9 @@ async def test_get_prompt_details_for_admin_not_found(
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_save_prompt_commit_new_prompt(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test saving a new prompt commit."""
     service = PromptService(db_session, cast(Redis, mock_redis))
@@ -265,13 +405,12 @@ async def test_save_prompt_commit_new_prompt(
     assert version_list[0].commit_message == "Initial commit"
 
     # Verify cache was invalidated
-    mock_redis.delete.assert_called_once_with("prompt_cache:new-slug")
+    mock_redis.unlink.assert_called_once_with("prompt_cache:new-slug")
 
 
-@pytest.mark.asyncio
 async def test_save_prompt_commit_update_existing(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test updating an existing prompt with new version."""
     # Create existing prompt with version
@@ -326,10 +465,52 @@ async def test_save_prompt_commit_update_existing(
     assert version_list[1].commit_message == "Updated commit"
 
 
-@pytest.mark.asyncio
+async def test_save_prompt_commit_updates_loaded_objects(
+    db_session: AsyncSession,
+    mock_redis: _RedisStub,
+) -> None:
+    """Test prompt objects already in the session reflect a new commit."""
+    prompt = Prompt(slug="loaded-slug", name="Loaded", content="Old content")
+    db_session.add(prompt)
+    await db_session.flush()
+
+    version1 = PromptVersion(
+        prompt_id=prompt.id,
+        version_number=1,
+        content="Old content",
+        commit_message="Initial",
+        is_active=True,
+    )
+    db_session.add(version1)
+    await db_session.commit()
+
+    service = PromptService(db_session, cast(Redis, mock_redis))
+
+    await service.save_prompt_commit(
+        slug="loaded-slug",
+        name="Reloaded",
+        content="New content",
+        commit_msg="Second",
+        prompt_id_str=str(prompt.id),
+    )
+
+    # No refresh: the instances loaded before the commit must not be stale
+    assert version1.is_active is False
+    assert prompt.name == "Reloaded"
+    assert prompt.content == "New content"
+
+    active = await db_session.scalars(
+        select(PromptVersion.version_number).where(
+            PromptVersion.prompt_id == prompt.id,
+            PromptVersion.is_active.is_(True),
+        ),
+    )
+    assert list(active) == [2]
+
+
 async def test_save_prompt_commit_by_slug(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test saving prompt commit by slug when prompt_id_str is None."""
     # Create existing prompt
@@ -347,16 +528,18 @@ async def test_save_prompt_commit_by_slug(
     )
 
     assert prompt_id == prompt.id
-    mock_redis.delete.assert_called_once_with("prompt_cache:slug-prompt")
+    mock_redis.unlink.assert_called_once_with("prompt_cache:slug-prompt")
 
 
-@pytest.mark.asyncio
 async def test_save_prompt_commit_with_user_id(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test saving prompt commit with user_id."""
-    user_id = uuid.uuid4()
+    user = User(name="Author", email="author@example.com", hashed_password="x")
+    db_session.add(user)
+    await db_session.flush()
+    user_id = user.id
     service = PromptService(db_session, cast(Redis, mock_redis))
 
     prompt_id = await service.save_prompt_commit(
@@ -374,10 +557,9 @@ async def test_save_prompt_commit_with_user_id(
     assert version.created_by_id == user_id
 
 
-@pytest.mark.asyncio
 async def test_activate_version_success(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test successfully activating a version."""
     # Create prompt with multiple versions
@@ -422,13 +604,12 @@ async def test_activate_version_success(
     assert prompt.content == "Version 1"
 
     # Verify cache was invalidated
-    mock_redis.delete.assert_called_once_with("prompt_cache:version-prompt")
+    mock_redis.unlink.assert_called_once_with("prompt_cache:version-prompt")
 
 
-@pytest.mark.asyncio
 async def test_activate_version_not_found(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test activating a version that doesn't exist."""
     prompt = Prompt(slug="test", name="Test", content="Content")
@@ -443,14 +624,17 @@ async def test_activate_version_not_found(
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_activate_version_prompt_not_found(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test activating a version when prompt doesn't exist."""
+    prompt = Prompt(slug="other-prompt", name="Other", content="Content")
+    db_session.add(prompt)
+    await db_session.flush()
+
     version = PromptVersion(
-        prompt_id=uuid.uuid4(),
+        prompt_id=prompt.id,
         version_number=1,
         content="Content",
         is_active=False,
@@ -466,10 +650,9 @@ async def test_activate_version_prompt_not_found(
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_get_cache_key(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test internal cache key generation."""
     service = PromptService(db_session, cast(Redis, mock_redis))
@@ -480,10 +663,9 @@ async def test_get_cache_key(
     assert key == "prompt_cache:test-slug"
 
 
-@pytest.mark.asyncio
 async def test_get_cached_content_prompt_without_content(
     db_session: AsyncSession,
-    mock_redis: AsyncMock,
+    mock_redis: _RedisStub,
 ) -> None:
     """Test getting cached content when prompt has no content."""
     prompt = Prompt(slug="empty-prompt", name="Empty", content=None)
@@ -3,37 +3,34 @@ from datetime import datetime
 
 import pytest
 from pydantic import SecretStr, ValidationError
+from pydantic.networks import validate_email
+from pydantic_core import PydanticCustomError
 
 from src.schemas import (Token, UserCreate, UserListResponse, UserLogin,
                          UserResponse, UserUpdate)
-
-
-def test_password_valid():
-    """Test that a valid password (length >= 8 + digit) passes."""
-    password = "SecurePassword1"
-    user = UserCreate(name="Test", email="test@example.com", password=password)
-    assert user.password.get_secret_value() == password
-
-
-def test_password_too_short():
-    """Test that passwords shorter than MIN_PASSWORD_LENGTH fail."""
-    short_pw = "Pass1"  # 5 chars
-    with pytest.raises(ValidationError) as exc:
-        UserCreate(name="Test", email="test@example.com", password=short_pw)
-
-    errors = exc.value.errors()
-    assert any(
-        "min_length" in e["type"] or "Password is too short" in e["msg"] for e in errors
-    )
-
-
-def test_password_no_digit():
-    """Test that a password without a number fails the custom validator."""
-    no_digit_pw = "PasswordWithoutNumber"
-    with pytest.raises(ValidationError) as exc:
-        UserCreate(name="Test", email="test@example.com", password=no_digit_pw)
-
-    assert "Password must contain a number" in str(exc.value)
+from src.schemas.user import normalize_email
+
+
+@pytest.mark.parametrize(
+    "pw,ok,msg",
+    [
+        ("SecurePassword1", True, None),
+        ("Pass1", False, "Password is too short"),
+        ("PasswordWithoutNumber", False, "Password must contain a number"),
+        ("SecurePassword\u00b2", True, None),
+    ],
+    ids=["valid", "too_short", "no_digit", "non_decimal_digit"],
+)
+def test_password(pw, ok, msg):
+    """Test that passwords need MIN_PASSWORD_LENGTH characters and a digit."""
+    if ok:
+        user = UserCreate(name="Test", email="test@example.com", password=pw)
+        assert user.password.get_secret_value() == pw
+    else:
+        with pytest.raises(ValidationError) as exc:
+            UserCreate(name="Test", email="test@example.com", password=pw)
+        errors = exc.value.errors(include_url=False, include_context=False)
+        assert any(e["loc"] == ("password",) and msg in e["msg"] for e in errors)
 
 
 def test_password_is_secret():
@@ -50,10 +47,42 @@ def test_user_create_email_normalization():
     assert user.email == "TEST@example.com"
 
 
+@pytest.mark.parametrize(
+    "email",
+    [
+        "TEST@Example.com",
+        "first.last+tag@sub.Example.co.uk",
+        "user_name%x@example-domain.org",
+        " padded@example.com ",
+        "Jane Doe <jane@example.com>",
+        "user@bücher.example",
+        "user@localhost.test",
+        "user@ab--cd.example.com",
+        "a..b@example.com",
+        "no-at-sign.example.com",
+        "user@example",
+        f"{'a' * 65}@example.com",
+    ],
+)
+def test_normalize_email_matches_email_str(email):
+    """Test that the ASCII fast path agrees with pydantic's EmailStr."""
+    try:
+        expected = validate_email(email)[1]
+    except PydanticCustomError:
+        with pytest.raises(PydanticCustomError):
+            normalize_email(email)
+    else:
+        assert normalize_email(email) == expected
+
+
 def test_user_create_invalid_email():
     with pytest.raises(ValidationError) as exc:
         UserCreate(name="Test", email="not-an-email", password="Password1")
-    assert "value is not a valid email address" in str(exc.value)
+    errors = exc.value.errors(include_url=False, include_context=False)
+    assert any(
+        e["loc"] == ("email",) and "value is not a valid email address" in e["msg"]
+        for e in errors
+    )
 
 
 def test_user_create_empty_name():
@@ -61,32 +90,44 @@ def test_user_create_empty_name():
         UserCreate(name="", email="test@example.com", password="Password1")
 
 
-def test_user_update_all_fields():
-    """Test updating all fields works."""
-    update = UserUpdate(
-        name="New Name",
-        email="new@example.com",
-        password="NewPassword1",
-        is_superuser=True,
-    )
-    assert update.name == "New Name"
-    assert update.password.get_secret_value() == "NewPassword1"
-    assert update.is_superuser is True
-
-
-def test_user_update_partial():
-    """Test updating only one field allows others to be None."""
-    update = UserUpdate(name="Just Name")
-    assert update.name == "Just Name"
-    assert update.email is None
-    assert update.password is None
+@pytest.mark.parametrize(
+    "fields,expected",
+    [
+        (
+            {
+                "name": "New Name",
+                "email": "new@example.com",
+                "password": "NewPassword1",
+                "is_superuser": True,
+            },
+            {"name": "New Name", "password": "NewPassword1", "is_superuser": True},
+        ),
+        (
+            {"name": "Just Name"},
+            {"name": "Just Name", "email": None, "password": None},
+        ),
+    ],
+    ids=["all_fields", "partial"],
+)
+def test_user_update(fields, expected):
+    """Test updating all or only some fields, leaving the rest as None."""
+    update = UserUpdate(**fields)
+    for attr, value in expected.items():
+        actual = getattr(update, attr)
+        if isinstance(actual, SecretStr):
+            actual = actual.get_secret_value()
+        assert actual == value
 
 
 def test_user_update_password_validation():
     """Test that the custom password validator still runs on Update schemas."""
     with pytest.raises(ValidationError) as exc:
         UserUpdate(password="NoDigit")
-    assert "Password must contain a number" in str(exc.value)
+    errors = exc.value.errors(include_url=False, include_context=False)
+    assert any(
+        e["loc"] == ("password",) and "Password must contain a number" in e["msg"]
+        for e in errors
+    )
 
 
 def test_user_response_serialization():
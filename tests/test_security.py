@@ -1,26 +1,48 @@
 """Tests for security utilities."""
 
-from datetime import UTC, datetime, timedelta
+import functools
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
 
+import jwt
 import pytest
-from jose import jwt
-from jose.exceptions import ExpiredSignatureError
+from jwt import ExpiredSignatureError
 
-from src.core.config import settings
+from src.core.config import Settings, settings
 from src.core.security import (
+    _reload_jwt_config,
     create_access_token,
+    decode_access_token,
     hash_password,
     verify_password,
 )
 
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture(
+    params=["TestPassword123", "P@ssw0rd!#$%^&*()", "Pässwörd测试123", ""],
+    ids=["plain", "special_characters", "unicode", "empty"],
+)
+def pw(request: pytest.FixtureRequest) -> str:
+    """Passwords of each shape the hashing helpers must handle."""
+    return request.param
+
+
+@pytest.fixture
+def pw_hash(pw: str, hashed: Callable[[str], str]) -> str:
+    """Hash of ``pw``, computed once per password for the test process."""
+    return hashed(pw)
+
 
 class TestHashPassword:
     """Tests for password hashing."""
 
-    def test_hash_password_returns_string(self) -> None:
-        """Test that hash_password returns a string."""
-        password = "TestPassword123"
-        hashed = hash_password(password)
+    def test_hash_password_returns_string(self, pw: str) -> None:
+        """Test that hash_password returns a non-empty string for any input."""
+        hashed = hash_password(pw)
         assert isinstance(hashed, str)
         assert len(hashed) > 0
 
@@ -32,71 +54,39 @@ class TestHashPassword:
         # Hashes should be different due to random salt
         assert hash1 != hash2
 
-    def test_hash_password_handles_special_characters(self) -> None:
-        """Test that hash_password handles special characters."""
-        password = "P@ssw0rd!#$%^&*()"
-        hashed = hash_password(password)
-        assert isinstance(hashed, str)
-        assert len(hashed) > 0
-
-    def test_hash_password_handles_unicode(self) -> None:
-        """Test that hash_password handles unicode characters."""
-        password = "Pässwörd测试123"
-        hashed = hash_password(password)
-        assert isinstance(hashed, str)
-        assert len(hashed) > 0
-
-    def test_hash_password_handles_empty_string(self) -> None:
-        """Test that hash_password handles empty string."""
-        password = ""
-        hashed = hash_password(password)
-        assert isinstance(hashed, str)
-        assert len(hashed) > 0
+    def test_hash_password_uses_production_rounds(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that hashing honours the default bcrypt work factor."""
+        default_rounds = Settings.model_fields["bcrypt_rounds"].default
+        assert default_rounds == 12
+        monkeypatch.setattr(settings, "bcrypt_rounds", default_rounds)
+        hashed = hash_password("TestPassword123")
+        assert hashed.startswith("$2b$12$")
+        assert verify_password("TestPassword123", hashed) is True
 
 
 class TestVerifyPassword:
     """Tests for password verification."""
 
-    def test_verify_password_correct_password(self) -> None:
+    def test_verify_password_correct_password(self, pw: str, pw_hash: str) -> None:
         """Test that verify_password returns True for correct password."""
-        password = "TestPassword123"
-        hashed = hash_password(password)
-        assert verify_password(password, hashed) is True
+        assert verify_password(pw, pw_hash) is True
 
-    def test_verify_password_incorrect_password(self) -> None:
+    def test_verify_password_incorrect_password(self, pw_hash: str) -> None:
         """Test that verify_password returns False for incorrect password."""
-        password = "TestPassword123"
-        wrong_password = "WrongPassword123"
-        hashed = hash_password(password)
-        assert verify_password(wrong_password, hashed) is False
-
-    def test_verify_password_empty_password(self) -> None:
-        """Test that verify_password handles empty password."""
-        password = ""
-        hashed = hash_password(password)
-        assert verify_password(password, hashed) is True
-        assert verify_password("not_empty", hashed) is False
-
-    def test_verify_password_case_sensitive(self) -> None:
+        assert verify_password("WrongPassword123", pw_hash) is False
+
+    def test_verify_password_case_sensitive(
+        self,
+        hashed: Callable[[str], str],
+    ) -> None:
         """Test that verify_password is case sensitive."""
         password = "TestPassword123"
-        hashed = hash_password(password)
-        assert verify_password("testpassword123", hashed) is False
-        assert verify_password("TestPassword123", hashed) is True
-
-    def test_verify_password_special_characters(self) -> None:
-        """Test that verify_password handles special characters correctly."""
-        password = "P@ssw0rd!#$%^&*()"
-        hashed = hash_password(password)
-        assert verify_password(password, hashed) is True
-        assert verify_password("P@ssw0rd!#$%^&*()", hashed) is True
-
-    def test_verify_password_unicode(self) -> None:
-        """Test that verify_password handles unicode characters."""
-        password = "Pässwörd测试123"
-        hashed = hash_password(password)
-        assert verify_password(password, hashed) is True
-        assert verify_password("different", hashed) is False
+        password_hash = hashed(password)
+        assert verify_password("testpassword123", password_hash) is False
+        assert verify_password("TestPassword123", password_hash) is True
 
     def test_verify_password_with_different_hashes(self) -> None:
         """Test verify_password works with different hashes of same password."""
@@ -108,6 +98,18 @@ class TestVerifyPassword:
         assert verify_password(password, hash2) is True
 
 
+@pytest.fixture(scope="module")
+def decode_token() -> Callable[[str], dict[str, Any]]:
+    """Return a decoder bound to the configured key, algorithm and claims."""
+    return functools.partial(
+        jwt.decode,
+        key=settings.jwt_secret_key.get_secret_value(),  # pylint: disable=no-member
+        algorithms=[settings.jwt_algorithm],
+        issuer=settings.jwt_issuer,
+        audience=settings.jwt_audience,
+    )
+
+
 class TestCreateAccessToken:
     """Tests for JWT token creation."""
 
@@ -118,27 +120,25 @@ class TestCreateAccessToken:
         assert isinstance(token, str)
         assert len(token) > 0
 
-    def test_create_access_token_with_custom_expires_delta(self) -> None:
+    def test_create_access_token_with_custom_expires_delta(
+        self,
+        decode_token: Callable[[str], dict[str, Any]],
+    ) -> None:
         """Test that create_access_token respects custom expiration."""
         data = {"sub": "test@example.com"}
         expires_delta = timedelta(minutes=30)
         token = create_access_token(data, expires_delta=expires_delta)
 
         # Decode and verify expiration
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key.get_secret_value(),  # pylint: disable=no-member
-            algorithms=[settings.jwt_algorithm],
-            issuer=settings.jwt_issuer,
-            audience=settings.jwt_audience,
-        )
-        exp = datetime.fromtimestamp(payload["exp"], tz=UTC)
-        now = datetime.now(UTC)
+        payload = decode_token(token)
         # Should expire in approximately 30 minutes
         # (allow 1 minute tolerance)
-        assert 29 * 60 <= (exp - now).total_seconds() <= 31 * 60
+        assert 29 * 60 <= payload["exp"] - time.time() <= 31 * 60
 
-    def test_create_access_token_default_expiration(self) -> None:
+    def test_create_access_token_default_expiration(
+        self,
+        decode_token: Callable[[str], dict[str, Any]],
+    ) -> None:
         """
         Test that create_access_token uses default expiration when not
         specified.
@@ -147,62 +147,45 @@ class TestCreateAccessToken:
         token = create_access_token(data)
 
         # Decode and verify expiration
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key.get_secret_value(),  # pylint: disable=no-member
-            algorithms=[settings.jwt_algorithm],
-            issuer=settings.jwt_issuer,
-            audience=settings.jwt_audience,
-        )
-        exp = datetime.fromtimestamp(payload["exp"], tz=UTC)
-        now = datetime.now(UTC)
+        payload = decode_token(token)
         # Should expire in approximately 15 minutes (default)
-        assert 14 * 60 <= (exp - now).total_seconds() <= 16 * 60
+        assert 14 * 60 <= payload["exp"] - time.time() <= 16 * 60
 
-    def test_create_access_token_contains_data(self) -> None:
+    def test_create_access_token_contains_data(
+        self,
+        decode_token: Callable[[str], dict[str, Any]],
+    ) -> None:
         """Test that create_access_token includes the provided data."""
         data = {"sub": "test@example.com", "user_id": "123"}
         token = create_access_token(data)
 
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key.get_secret_value(),  # pylint: disable=no-member
-            algorithms=[settings.jwt_algorithm],
-            issuer=settings.jwt_issuer,
-            audience=settings.jwt_audience,
-        )
+        payload = decode_token(token)
         assert payload["sub"] == "test@example.com"
         assert payload["user_id"] == "123"
         assert "exp" in payload
 
-    def test_create_access_token_includes_expiration(self) -> None:
+    def test_create_access_token_includes_expiration(
+        self,
+        decode_token: Callable[[str], dict[str, Any]],
+    ) -> None:
         """Test that create_access_token includes expiration claim."""
         data = {"sub": "test@example.com"}
         token = create_access_token(data)
 
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key.get_secret_value(),  # pylint: disable=no-member
-            algorithms=[settings.jwt_algorithm],
-            issuer=settings.jwt_issuer,
-            audience=settings.jwt_audience,
-        )
+        payload = decode_token(token)
         assert "exp" in payload
         assert isinstance(payload["exp"], int)
 
-    def test_create_access_token_uses_correct_algorithm(self) -> None:
+    def test_create_access_token_uses_correct_algorithm(
+        self,
+        decode_token: Callable[[str], dict[str, Any]],
+    ) -> None:
         """Test that create_access_token uses the configured algorithm."""
         data = {"sub": "test@example.com"}
         token = create_access_token(data)
 
         # Should decode successfully with the configured algorithm
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key.get_secret_value(),  # pylint: disable=no-member
-            algorithms=[settings.jwt_algorithm],
-            issuer=settings.jwt_issuer,
-            audience=settings.jwt_audience,
-        )
+        payload = decode_token(token)
         assert payload["sub"] == "test@example.com"
 
     def test_create_access_token_diff_data(self) -> None:
@@ -224,7 +207,10 @@ class TestCreateAccessToken:
         # Tokens should be different due to different expiration times
         assert token1 != token2
 
-    def test_create_access_token_with_complex_data(self) -> None:
+    def test_create_access_token_with_complex_data(
+        self,
+        decode_token: Callable[[str], dict[str, Any]],
+    ) -> None:
         """Test that create_access_token handles complex data structures."""
         data = {
             "sub": "test@example.com",
@@ -233,19 +219,14 @@ class TestCreateAccessToken:
         }
         token = create_access_token(data)
 
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key.get_secret_value(),  # pylint: disable=no-member
-            algorithms=[settings.jwt_algorithm],
-            issuer=settings.jwt_issuer,
-            audience=settings.jwt_audience,
-        )
+        payload = decode_token(token)
         assert payload["sub"] == "test@example.com"
         assert payload["roles"] == ["admin", "user"]
         assert payload["metadata"] == {"key": "value"}
 
     def test_create_access_token_expired_token_fails_verification(
         self,
+        decode_token: Callable[[str], dict[str, Any]],
     ) -> None:
         """Test that an expired token fails verification."""
         data = {"sub": "test@example.com"}
@@ -255,10 +236,48 @@ class TestCreateAccessToken:
 
         # Should raise exception when trying to decode expired token
         with pytest.raises(ExpiredSignatureError):
-            jwt.decode(
-                token,
-                settings.jwt_secret_key.get_secret_value(),  # pylint: disable=no-member
-                algorithms=[settings.jwt_algorithm],
-                issuer=settings.jwt_issuer,
-                audience=settings.jwt_audience,
-            )
+            decode_token(token)
+
+    def test_create_access_token_uses_reloaded_config(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that changed JWT settings take effect after a reload."""
+        monkeypatch.setattr(settings, "jwt_algorithm", "HS512")
+        _reload_jwt_config()
+        try:
+            token = create_access_token({"sub": "test@example.com"})
+            assert jwt.get_unverified_header(token)["alg"] == "HS512"
+            assert decode_access_token(token)["sub"] == "test@example.com"
+        finally:
+            monkeypatch.undo()
+            _reload_jwt_config()
+
+
+class TestDecodeAccessToken:
+    """Tests for JWT token decoding."""
+
+    def test_decode_access_token_round_trip(self) -> None:
+        """Test that a created token decodes to its claims."""
+        token = create_access_token({"sub": "test@example.com"})
+
+        payload = decode_access_token(token)
+
+        assert payload["sub"] == "test@example.com"
+        assert payload["iss"] == settings.jwt_issuer
+        assert payload["aud"] == settings.jwt_audience
+
+    def test_decode_access_token_rejects_other_key(self) -> None:
+        """Test that a token signed with another key is rejected."""
+        token = jwt.encode(
+            {
+                "sub": "test@example.com",
+                "iss": settings.jwt_issuer,
+                "aud": settings.jwt_audience,
+            },
+            "another-secret-key-that-is-long-enough",
+            algorithm=settings.jwt_algorithm,
+        )
+
+        with pytest.raises(jwt.InvalidSignatureError):
+            decode_access_token(token)
@@ -1,12 +1,15 @@
 """Tests for user service."""
 
 import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 from pydantic import SecretStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.security import verify_password
+from src.models.user import User
 from src.schemas.user import UserCreate, UserUpdate
 from src.services.user_service import (
     UserAlreadyDeletedError,
@@ -16,15 +19,83 @@ from src.services.user_service import (
 )
 
 
-@pytest.mark.asyncio
-async def test_create_user_success(db_session: AsyncSession) -> None:
+MakeUser = Callable[..., Awaitable[User]]
+
+# No user is ever created with this id.
+_MISSING_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+# Built once without validation; tests copy it with the fields they change.
+_USER_CREATE = UserCreate.model_construct(
+    name="Test User",
+    email="test@example.com",
+    password=SecretStr("SecurePass123"),
+)
+
+
+def _user_create(**overrides: Any) -> UserCreate:
+    return _USER_CREATE.model_copy(update=overrides)
+
+
+class _FakeHasher:
+    """Hasher without a KDF; bcrypt itself is covered in test_security."""
+
+    def hash(self, password: str) -> str:
+        return "fake$" + password
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return hashed_password == "fake$" + plain_password
+
+
+_HASHER = _FakeHasher()
+
+
+@pytest.fixture
+def user_service(db_session: AsyncSession) -> UserService:
+    """Create a user service bound to the per-test session."""
+    return UserService(db_session, hasher=_HASHER)
+
+
+@pytest.fixture
+def make_user(db_session: AsyncSession) -> MakeUser:
+    """Return a factory that inserts a user directly, skipping create_user.
+
+    For tests whose subject is not user creation.
+    """
+
+    async def _make_user(
+        name: str = "Test User",
+        email: str = "test@example.com",
+        password: str = "SecurePass123",
+    ) -> User:
+        user = User(
+            name=name,
+            email=email,
+            hashed_password=_HASHER.hash(password),
+            is_deleted=False,
+            is_superuser=False,
+        )
+        db_session.add(user)
+        await db_session.flush()
+        return user
+
+    return _make_user
+
+
+def _user_rows(n: int, hashed_password: str) -> list[dict[str, Any]]:
+    """Build ``n`` distinct user rows for a bulk insert."""
+    return [
+        {
+            "name": f"User {i}",
+            "email": f"user{i}@example.com",
+            "hashed_password": hashed_password,
+        }
+        for i in range(n)
+    ]
+
+
+async def test_create_user_success(user_service: UserService) -> None:
     """Test successful user creation."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
-    )
+    user_data = _user_create()
 
     user = await user_service.create_user(user_data)
 
@@ -32,21 +103,15 @@ async def test_create_user_success(db_session: AsyncSession) -> None:
     assert user.name == "Test User"
     assert user.email == "test@example.com"
     assert user.hashed_password != "SecurePass123"  # Should be hashed
-    assert verify_password("SecurePass123", user.hashed_password)
+    assert _HASHER.verify("SecurePass123", user.hashed_password)
     assert user.is_deleted is False
     assert user.is_superuser is False
     assert user.created_at is not None
 
 
-@pytest.mark.asyncio
-async def test_create_user_duplicate_email(db_session: AsyncSession) -> None:
+async def test_create_user_duplicate_email(user_service: UserService) -> None:
     """Test creating user with duplicate email fails."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
-    )
+    user_data = _user_create()
 
     # Create first user
     await user_service.create_user(user_data)
@@ -58,17 +123,12 @@ async def test_create_user_duplicate_email(db_session: AsyncSession) -> None:
     assert "already exists" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
-async def test_get_user_by_id_success(db_session: AsyncSession) -> None:
+async def test_get_user_by_id_success(
+    user_service: UserService,
+    make_user: MakeUser,
+) -> None:
     """Test getting user by ID when user exists."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-
-    created_user = await user_service.create_user(user_data)
+    created_user = await make_user()
     found_user = await user_service.get_user_by_id(created_user.id)
 
     assert found_user is not None
@@ -77,28 +137,19 @@ async def test_get_user_by_id_success(db_session: AsyncSession) -> None:
     assert found_user.name == "Test User"
 
 
-@pytest.mark.asyncio
-async def test_get_user_by_id_not_found(db_session: AsyncSession) -> None:
+async def test_get_user_by_id_not_found(user_service: UserService) -> None:
     """Test getting user by ID when user doesn't exist."""
-    user_service = UserService(db_session)
-    non_existent_id = uuid.uuid4()
-
-    found_user = await user_service.get_user_by_id(non_existent_id)
+    found_user = await user_service.get_user_by_id(_MISSING_ID)
 
     assert found_user is None
 
 
-@pytest.mark.asyncio
-async def test_get_user_by_email_success(db_session: AsyncSession) -> None:
+async def test_get_user_by_email_success(
+    user_service: UserService,
+    make_user: MakeUser,
+) -> None:
     """Test getting user by email when user exists."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-
-    await user_service.create_user(user_data)
+    await make_user()
     found_user = await user_service.get_user_by_email("test@example.com")
 
     assert found_user is not None
@@ -106,11 +157,8 @@ async def test_get_user_by_email_success(db_session: AsyncSession) -> None:
     assert found_user.name == "Test User"
 
 
-@pytest.mark.asyncio
-async def test_get_user_by_email_not_found(db_session: AsyncSession) -> None:
+async def test_get_user_by_email_not_found(user_service: UserService) -> None:
     """Test getting user by email when user doesn't exist."""
-    user_service = UserService(db_session)
-
     found_user = await user_service.get_user_by_email(
         "nonexistent@example.com"
     )
@@ -118,17 +166,12 @@ async def test_get_user_by_email_not_found(db_session: AsyncSession) -> None:
     assert found_user is None
 
 
-@pytest.mark.asyncio
-async def test_update_user_success(db_session: AsyncSession) -> None:
+async def test_update_user_success(
+    user_service: UserService,
+    make_user: MakeUser,
+) -> None:
     """Test successful user update."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-
-    created_user = await user_service.create_user(user_data)
+    created_user = await make_user()
     update_data = UserUpdate(
         name="Updated Name",
         is_superuser=True,
@@ -143,17 +186,12 @@ async def test_update_user_success(db_session: AsyncSession) -> None:
     assert updated_user.email == "test@example.com"  # Unchanged
 
 
-@pytest.mark.asyncio
-async def test_update_user_partial(db_session: AsyncSession) -> None:
+async def test_update_user_partial(
+    user_service: UserService,
+    make_user: MakeUser,
+) -> None:
     """Test partial user update."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-
-    created_user = await user_service.create_user(user_data)
+    created_user = await make_user()
     update_data = UserUpdate(
         name="Updated Name",
         email=None,
@@ -168,11 +206,8 @@ async def test_update_user_partial(db_session: AsyncSession) -> None:
     assert updated_user.is_superuser is False  # Unchanged
 
 
-@pytest.mark.asyncio
-async def test_update_user_not_found(db_session: AsyncSession) -> None:
+async def test_update_user_not_found(user_service: UserService) -> None:
     """Test updating non-existent user fails."""
-    user_service = UserService(db_session)
-    non_existent_id = uuid.uuid4()
     update_data = UserUpdate(
         name="Updated Name",
         email=None,
@@ -181,30 +216,19 @@ async def test_update_user_not_found(db_session: AsyncSession) -> None:
     )
 
     with pytest.raises(UserNotFoundError) as exc_info:
-        await user_service.update_user(non_existent_id, update_data)
+        await user_service.update_user(_MISSING_ID, update_data)
 
     assert "not found" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
-async def test_update_user_duplicate_email(db_session: AsyncSession) -> None:
+async def test_update_user_duplicate_email(
+    user_service: UserService,
+    make_user: MakeUser,
+) -> None:
     """Test updating user with duplicate email fails."""
-    user_service = UserService(db_session)
-
     # Create two users
-    user1_data = UserCreate(
-        name="User 1",
-        email="user1@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-    user2_data = UserCreate(
-        name="User 2",
-        email="user2@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-
-    user1 = await user_service.create_user(user1_data)
-    await user_service.create_user(user2_data)
+    user1 = await make_user(name="User 1", email="user1@example.com")
+    await make_user(name="User 2", email="user2@example.com")
 
     # Try to update user1 with user2's email
     update_data = UserUpdate(
@@ -220,17 +244,12 @@ async def test_update_user_duplicate_email(db_session: AsyncSession) -> None:
     assert "already exists" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
-async def test_update_user_same_email(db_session: AsyncSession) -> None:
+async def test_update_user_same_email(
+    user_service: UserService,
+    make_user: MakeUser,
+) -> None:
     """Test updating user with same email succeeds."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-
-    created_user = await user_service.create_user(user_data)
+    created_user = await make_user()
     update_data = UserUpdate(
         email="test@example.com",
         name="Updated Name",
@@ -244,25 +263,21 @@ async def test_update_user_same_email(db_session: AsyncSession) -> None:
     assert updated_user.name == "Updated Name"
 
 
-@pytest.mark.asyncio
-async def test_delete_user_soft_delete(db_session: AsyncSession) -> None:
+async def test_delete_user_soft_delete(
+    user_service: UserService,
+    make_user: MakeUser,
+) -> None:
     """Test soft deleting a user."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
+    created_user = await make_user()
+    deleted_user = await user_service.delete_user(
+        created_user.id,
+        hard_delete=False,
     )
 
-    created_user = await user_service.create_user(user_data)
-    result = await user_service.delete_user(created_user.id, hard_delete=False)
-
-    assert result is True
-
     # Verify soft delete
-    await db_session.refresh(created_user)
-    assert created_user.is_deleted is True
-    assert created_user.deleted_at is not None
+    assert deleted_user.id == created_user.id
+    assert deleted_user.is_deleted is True
+    assert deleted_user.deleted_at is not None
 
     # User should not be found in normal queries
     found_user = await user_service.get_user_by_id(created_user.id)
@@ -270,50 +285,36 @@ async def test_delete_user_soft_delete(db_session: AsyncSession) -> None:
     assert found_user.is_deleted is True
 
 
-@pytest.mark.asyncio
-async def test_delete_user_hard_delete(db_session: AsyncSession) -> None:
+async def test_delete_user_hard_delete(
+    user_service: UserService,
+    make_user: MakeUser,
+) -> None:
     """Test hard deleting a user."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-
-    created_user = await user_service.create_user(user_data)
+    created_user = await make_user()
     user_id = created_user.id
-    result = await user_service.delete_user(user_id, hard_delete=True)
+    deleted_user = await user_service.delete_user(user_id, hard_delete=True)
 
-    assert result is True
+    assert deleted_user.id == user_id
 
     # User should not be found
     found_user = await user_service.get_user_by_id(user_id)
     assert found_user is None
 
 
-@pytest.mark.asyncio
-async def test_delete_user_not_found(db_session: AsyncSession) -> None:
+async def test_delete_user_not_found(user_service: UserService) -> None:
     """Test deleting non-existent user fails."""
-    user_service = UserService(db_session)
-    non_existent_id = uuid.uuid4()
-
     with pytest.raises(UserNotFoundError) as exc_info:
-        await user_service.delete_user(non_existent_id)
+        await user_service.delete_user(_MISSING_ID)
 
     assert "not found" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
-async def test_delete_user_already_deleted(db_session: AsyncSession) -> None:
+async def test_delete_user_already_deleted(
+    user_service: UserService,
+    make_user: MakeUser,
+) -> None:
     """Test deleting already soft-deleted user fails."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-
-    created_user = await user_service.create_user(user_data)
+    created_user = await make_user()
     await user_service.delete_user(created_user.id, hard_delete=False)
 
     # Try to delete again
@@ -323,30 +324,25 @@ async def test_delete_user_already_deleted(db_session: AsyncSession) -> None:
     assert "already deleted" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
-async def test_list_users_empty(db_session: AsyncSession) -> None:
+async def test_list_users_empty(user_service: UserService) -> None:
     """Test listing users when no users exist."""
-    user_service = UserService(db_session)
-
     users, total = await user_service.list_users()
 
     assert users == []
     assert total == 0
 
 
-@pytest.mark.asyncio
-async def test_list_users_pagination(db_session: AsyncSession) -> None:
+async def test_list_users_pagination(
+    db_session: AsyncSession,
+    user_service: UserService,
+    bulk_insert: Callable[..., Awaitable[None]],
+) -> None:
     """Test listing users with pagination."""
-    user_service = UserService(db_session)
-
-    # Create 5 users
-    for i in range(5):
-        user_data = UserCreate(
-            name=f"User {i}",
-            email=f"user{i}@example.com",
-            password=SecretStr("SecurePass123"),
-        )
-        await user_service.create_user(user_data)
+    await bulk_insert(
+        db_session,
+        User,
+        _user_rows(5, _HASHER.hash("SecurePass123")),
+    )
 
     # Get first page
     users_page1, total = await user_service.list_users(page=1, page_size=2)
@@ -364,28 +360,49 @@ async def test_list_users_pagination(db_session: AsyncSession) -> None:
     assert users_page1[0].id != users_page2[0].id
 
 
-@pytest.mark.asyncio
-async def test_list_users_exclude_deleted(db_session: AsyncSession) -> None:
-    """Test listing users excludes deleted users by default."""
-    user_service = UserService(db_session)
-
-    # Create 3 users
-    user1_data = UserCreate(
-        name="User 1",
-        email="user1@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-    user2_data = UserCreate(
-        name="User 2",
-        email="user2@example.com",
-        password=SecretStr("SecurePass123"),
+async def test_list_users_page_past_end(
+    db_session: AsyncSession,
+    user_service: UserService,
+    bulk_insert: Callable[..., Awaitable[None]],
+) -> None:
+    """Test listing a page past the end still reports the total."""
+    await bulk_insert(
+        db_session,
+        User,
+        _user_rows(3, _HASHER.hash("SecurePass123")),
     )
-    user3_data = UserCreate(
-        name="User 3",
-        email="user3@example.com",
-        password=SecretStr("SecurePass123"),
+
+    users, total = await user_service.list_users(page=3, page_size=2)
+
+    assert users == []
+    assert total == 3
+
+
+async def test_list_users_zero_page_size(
+    db_session: AsyncSession,
+    user_service: UserService,
+    bulk_insert: Callable[..., Awaitable[None]],
+) -> None:
+    """Test a zero page size returns no users but still reports the total."""
+    await bulk_insert(
+        db_session,
+        User,
+        _user_rows(3, _HASHER.hash("SecurePass123")),
     )
 
+    users, total = await user_service.list_users(page=1, page_size=0)
+
+    assert users == []
+    assert total == 3
+
+
+async def test_list_users_exclude_deleted(user_service: UserService) -> None:
+    """Test listing users excludes deleted users by default."""
+    # Create 3 users
+    user1_data = _user_create(name="User 1", email="user1@example.com")
+    user2_data = _user_create(name="User 2", email="user2@example.com")
+    user3_data = _user_create(name="User 3", email="user3@example.com")
+
     user1 = await user_service.create_user(user1_data)
     await user_service.create_user(user2_data)
     await user_service.create_user(user3_data)
@@ -401,22 +418,11 @@ async def test_list_users_exclude_deleted(db_session: AsyncSession) -> None:
     assert all(not user.is_deleted for user in users)
 
 
-@pytest.mark.asyncio
-async def test_list_users_include_deleted(db_session: AsyncSession) -> None:
+async def test_list_users_include_deleted(user_service: UserService) -> None:
     """Test listing users includes deleted users when requested."""
-    user_service = UserService(db_session)
-
     # Create 2 users
-    user1_data = UserCreate(
-        name="User 1",
-        email="user1@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-    user2_data = UserCreate(
-        name="User 2",
-        email="user2@example.com",
-        password=SecretStr("SecurePass123"),
-    )
+    user1_data = _user_create(name="User 1", email="user1@example.com")
+    user2_data = _user_create(name="User 2", email="user2@example.com")
 
     user1 = await user_service.create_user(user1_data)
     await user_service.create_user(user2_data)
@@ -432,55 +438,39 @@ async def test_list_users_include_deleted(db_session: AsyncSession) -> None:
     assert any(user.is_deleted for user in users)
 
 
-@pytest.mark.asyncio
-async def test_verify_user_password_success(db_session: AsyncSession) -> None:
-    """Test verifying correct password."""
-    user_service = UserService(db_session)
-    password = "SecurePass123"
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr(password),
-    )
-
-    created_user = await user_service.create_user(user_data)
-    verified_user = await user_service.verify_user_password(
-        "test@example.com",
-        password,
-    )
-
-    assert verified_user is not None
-    assert verified_user.id == created_user.id
-    assert verified_user.email == "test@example.com"
-
-
-@pytest.mark.asyncio
-async def test_verify_user_password_wrong_password(
-    db_session: AsyncSession,
+@pytest.mark.parametrize(
+    "password,matches",
+    [("SecurePass123", True), ("WrongPassword123", False)],
+    ids=["correct", "wrong"],
+)
+async def test_verify_user_password(
+    user_service: UserService,
+    make_user: MakeUser,
+    password: str,
+    matches: bool,
 ) -> None:
-    """Test verifying wrong password returns None."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-
-    await user_service.create_user(user_data)
+    """Test verifying a password returns the user only when it matches."""
+    created_user = await make_user(password="SecurePass123")
     verified_user = await user_service.verify_user_password(
         "test@example.com",
-        "WrongPassword123",
+        password,
     )
 
-    assert verified_user is None
+    if matches:
+        assert verified_user is not None
+        assert verified_user.id == created_user.id
+        assert verified_user.email == "test@example.com"
+    else:
+        assert verified_user is None
 
 
-@pytest.mark.asyncio
 async def test_verify_user_password_user_not_found(
-    db_session: AsyncSession,
+    user_service: UserService,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test verifying password for non-existent user returns None."""
-    user_service = UserService(db_session)
+    mock_verify = MagicMock()
+    monkeypatch.setattr(user_service.hasher, "verify", mock_verify)
 
     verified_user = await user_service.verify_user_password(
         "nonexistent@example.com",
@@ -488,29 +478,23 @@ async def test_verify_user_password_user_not_found(
     )
 
     assert verified_user is None
+    # The injected hasher's verify is never called when no user matches
+    mock_verify.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_user_exists_true(db_session: AsyncSession) -> None:
-    """Test user_exists returns True when user exists."""
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        name="Test User",
-        email="test@example.com",
-        password=SecretStr("SecurePass123"),
-    )
-
-    await user_service.create_user(user_data)
-    exists = await user_service.user_exists("test@example.com")
-
-    assert exists is True
-
-
-@pytest.mark.asyncio
-async def test_user_exists_false(db_session: AsyncSession) -> None:
-    """Test user_exists returns False when user doesn't exist."""
-    user_service = UserService(db_session)
-
-    exists = await user_service.user_exists("nonexistent@example.com")
+@pytest.mark.parametrize(
+    "email,expected",
+    [("test@example.com", True), ("nonexistent@example.com", False)],
+    ids=["existing", "missing"],
+)
+async def test_user_exists(
+    user_service: UserService,
+    make_user: MakeUser,
+    email: str,
+    expected: bool,
+) -> None:
+    """Test user_exists reports whether a user has the given email."""
+    await make_user()
+    exists = await user_service.user_exists(email)
 
-    assert exists is False
+    assert exists is expected